@@ -69,8 +69,8 @@ License: See LICENSE file
 Author: Wordle CSP Team
 """
 
-from .csp_solver import WordleCSPSolver, Feedback
-from .dictionary_manager import DictionaryManager
+from .csp_solver import WordleCSPSolver, Feedback, encode_feedback, decode_feedback
+from .dictionary_manager import DictionaryManager, get_encoded_dictionary
 from .optimizer import WordleOptimizer
 from .llm_integration import WordleLLMAssistant
 
@@ -79,14 +79,10 @@ __author__ = "Wordle CSP Team"
 __all__ = [
     "WordleCSPSolver",
     "Feedback",
-    "WordleOptimizer",
-    "DictionaryManager",
-    "WordleLLMAssistant",
-]
-__all__ = [
-    "WordleCSPSolver",
-    "Feedback",
+    "encode_feedback",
+    "decode_feedback",
     "DictionaryManager",
+    "get_encoded_dictionary",
     "WordleOptimizer",
     "WordleLLMAssistant"
 ]
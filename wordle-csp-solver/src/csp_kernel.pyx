@@ -0,0 +1,164 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional compiled kernel for the Wordle CSP solver.
+Fuses constraint filtering and letter-frequency scoring into a single
+pass over the alive words, and simulates Wordle feedback on bytes.
+
+Build in place (from src/):
+    cythonize -i csp_kernel.pyx
+
+WordleCSPSolver picks the kernel up automatically when the compiled module
+is importable and falls back to NumPy otherwise; test_snail_bug.py checks
+simulate_feedback against its reference simulator when the module is built.
+"""
+
+from libc.stdint cimport uint8_t, uint64_t, int32_t
+from libc.stdlib cimport calloc, free
+
+
+def filter_and_score(
+    const uint8_t[:, ::1] codes,
+    const uint64_t[::1] masks,
+    const Py_ssize_t[::1] ids,
+    Py_ssize_t[::1] out,
+    uint64_t required,
+    uint64_t forbidden,
+    const int32_t[::1] green_pos,
+    const uint8_t[::1] green_code,
+    const int32_t[::1] wrong_pos,
+    const uint8_t[::1] wrong_code,
+    int alphabet_size
+):
+    """
+    Filter the alive words and return the best-scoring survivor.
+
+    Only the rows listed in ids are visited, so the cost follows the current
+    candidate pool rather than the dictionary.
+
+    Args:
+        codes: (N, word_length) letter codes of the dictionary
+        masks: (N,) letter presence masks
+        ids: (M,) ids of the alive words, ascending
+        out: (M,) receives the ids of the surviving words, in the same order
+        required: Mask of letters every word must contain
+        forbidden: Mask of letters no word may contain
+        green_pos, green_code: Positions that must hold the given letter
+        wrong_pos, wrong_code: Positions that must not hold the given letter
+        alphabet_size: Number of distinct letter codes
+
+    Returns:
+        Tuple of (number of survivors written to out, id of the survivor
+        with the highest frequency score, lowest id on ties, or -1 if no
+        word survives)
+    """
+    cdef Py_ssize_t n = ids.shape[0]
+    cdef Py_ssize_t length = codes.shape[1]
+    cdef Py_ssize_t i, w, p, k
+    cdef Py_ssize_t kept = 0
+    cdef uint64_t m
+    cdef bint ok
+    cdef long total, unique
+    cdef double score
+    cdef double best_score = -1.0
+    cdef Py_ssize_t best = -1
+
+    if out.shape[0] < n:
+        raise ValueError("out must be at least as long as ids")
+
+    cdef int32_t *freq = <int32_t *> calloc(length * alphabet_size, sizeof(int32_t))
+    if freq == NULL:
+        raise MemoryError()
+
+    try:
+        with nogil:
+            # Filter pass: test every constraint, compact the survivors into
+            # out and count their letters
+            for i in range(n):
+                w = ids[i]
+                m = masks[w]
+                ok = (m & required) == required and (m & forbidden) == 0
+                k = 0
+                while ok and k < green_pos.shape[0]:
+                    ok = codes[w, green_pos[k]] == green_code[k]
+                    k += 1
+                k = 0
+                while ok and k < wrong_pos.shape[0]:
+                    ok = codes[w, wrong_pos[k]] != wrong_code[k]
+                    k += 1
+
+                if not ok:
+                    continue
+
+                out[kept] = w
+                kept += 1
+                for p in range(length):
+                    freq[p * alphabet_size + codes[w, p]] += 1
+
+            # Score pass: summed position frequencies + 0.1 per unique letter
+            for i in range(kept):
+                w = out[i]
+                total = 0
+                for p in range(length):
+                    total += freq[p * alphabet_size + codes[w, p]]
+
+                m = masks[w]
+                unique = 0
+                while m:
+                    m &= m - 1
+                    unique += 1
+
+                score = total + unique * 0.1
+                if score > best_score:
+                    best_score = score
+                    best = w
+    finally:
+        free(freq)
+
+    return kept, best
+
+
+def simulate_feedback(
+    const uint8_t[::1] guess,
+    const uint8_t[::1] target,
+    uint8_t[::1] out
+):
+    """
+    Two-pass Wordle feedback of a guess against a target, as byte strings.
+
+    Args:
+        guess: (k,) bytes of the guess
+        target: (k,) bytes of the target
+        out: (k,) receives 0 (absent), 1 (present) or 2 (correct) per letter
+
+    Returns:
+        The feedback packed as a base-3 int, first letter most significant
+        (same as csp_solver.encode_feedback)
+    """
+    cdef Py_ssize_t k = guess.shape[0]
+    cdef Py_ssize_t i
+    cdef long code = 0
+    # Target letters not matched by a green, per byte value
+    cdef int32_t counts[256]
+
+    if target.shape[0] != k or out.shape[0] != k:
+        raise ValueError("guess, target and out must have the same length")
+
+    with nogil:
+        for i in range(256):
+            counts[i] = 0
+
+        for i in range(k):
+            if guess[i] == target[i]:
+                out[i] = 2
+            else:
+                out[i] = 0
+                counts[target[i]] += 1
+
+        # Yellows left to right, one unmatched target copy each
+        for i in range(k):
+            if out[i] == 0 and counts[guess[i]] > 0:
+                out[i] = 1
+                counts[guess[i]] -= 1
+            code = code * 3 + out[i]
+
+    return code
@@ -1,18 +1,246 @@
 """
 CSP Solver for Wordle using Constraint Satisfaction
 Implements constraint satisfaction to solve Wordle puzzles efficiently.
-No external CSP libraries needed - uses pure Python constraint propagation.
+No external CSP libraries needed - constraints are propagated as vectorized
+NumPy bit operations over a packed encoding of the dictionary.
 """
 
-from typing import List, Dict, Set, Tuple
-from enum import Enum
+from typing import List, Dict, Set, Tuple, Iterable, Iterator, Optional, Union
+from enum import IntEnum
 
+import numpy as np
 
-class Feedback(Enum):
-    """Feedback types for Wordle guesses"""
-    CORRECT = "green"    # Letter in correct position
-    PRESENT = "yellow"   # Letter in word but wrong position
-    ABSENT = "gray"      # Letter not in word
+try:
+    from numba import get_num_threads, njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is optional: kernels stay plain Python and callers use the
+    # interpreted scoring path instead
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def get_num_threads():
+        return 1
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    from .dictionary_manager import get_encoded_dictionary
+except ImportError:
+    from dictionary_manager import get_encoded_dictionary
+
+try:
+    from .csp_kernel import filter_and_score
+except ImportError:
+    try:
+        from csp_kernel import filter_and_score
+    except ImportError:
+        # Compiled kernel is optional (cythonize -i csp_kernel.pyx)
+        filter_and_score = None
+
+
+class Feedback(IntEnum):
+    """
+    Feedback types for Wordle guesses.
+
+    Members are small ints, so comparisons are plain int compares; the
+    values double as base-3 digits and match the optimizer's pattern values.
+    """
+    CORRECT = 2   # Letter in correct position (green)
+    PRESENT = 1   # Letter in word but wrong position (yellow)
+    ABSENT = 0    # Letter not in word (gray)
+
+
+_INT_TO_FB = (Feedback.ABSENT, Feedback.PRESENT, Feedback.CORRECT)
+
+
+def encode_feedback(feedback: Iterable[Feedback]) -> int:
+    """
+    Pack a feedback list into a single base-3 integer.
+
+    The first letter is the most significant digit, with ABSENT=0,
+    PRESENT=1, CORRECT=2; 5-letter feedback fits in 0..242.
+
+    Args:
+        feedback: List of Feedback for each letter
+
+    Returns:
+        Feedback code
+    """
+    code = 0
+    for fb in feedback:
+        code = code * 3 + fb
+    return code
+
+
+def decode_feedback(code: int, length: int) -> List[Feedback]:
+    """
+    Unpack a code from encode_feedback() back into a feedback list.
+
+    Args:
+        code: Feedback code
+        length: Number of letters
+
+    Returns:
+        List of Feedback for each letter
+    """
+    feedback = [Feedback.ABSENT] * length
+    for i in range(length - 1, -1, -1):
+        code, digit = divmod(code, 3)
+        feedback[i] = _INT_TO_FB[digit]
+    return feedback
+
+
+def _position_frequencies(codes: np.ndarray, alphabet_size: int) -> np.ndarray:
+    """
+    Count letter occurrences at each position in one vectorized accumulate.
+
+    Args:
+        codes: (N, word_length) letter codes
+        alphabet_size: Number of distinct letter codes
+
+    Returns:
+        (word_length, alphabet_size) int32 table of counts
+    """
+    freq = np.zeros((codes.shape[1], alphabet_size), dtype=np.int32)
+    positions = np.broadcast_to(np.arange(codes.shape[1]), codes.shape)
+    np.add.at(freq, (positions, codes), 1)
+    return freq
+
+
+# Pools at or below this size are filtered word by word in Python
+_SMALL_POOL = 32
+
+# Pools at or above this size are filtered by the parallel Numba kernel
+_PARALLEL_POOL = 4096
+
+# Pools at or below this size are scored with plain Python loops
+_SMALL_SCORING_POOL = 20
+
+# Number of set bits in each byte value, for popcounting the presence masks
+_POPCOUNT8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _frequency_scores(codes: np.ndarray, masks: np.ndarray, freq: np.ndarray) -> np.ndarray:
+    """
+    Letter-frequency score of every candidate as one gather and row sum.
+
+    Args:
+        codes: (N, word_length) letter codes of the candidates
+        masks: (N,) uint64 presence masks of the candidates
+        freq: (word_length, alphabet_size) letter counts over the candidates
+
+    Returns:
+        (N,) float64 scores: summed position frequencies + 0.1 per unique letter
+    """
+    positions = np.arange(codes.shape[1])[None, :]
+    totals = freq[positions, codes].sum(axis=1)
+    unique = _POPCOUNT8[masks.view(np.uint8)].reshape(len(masks), 8).sum(axis=1)
+    return totals + unique * 0.1
+
+
+@njit
+def _max_information_index(codes: np.ndarray, masks: np.ndarray, freq: np.ndarray) -> int:
+    """
+    Index of the candidate with the highest letter-frequency score.
+
+    Args:
+        codes: (N, word_length) letter codes of the candidates
+        masks: (N,) presence masks of the candidates
+        freq: (word_length, alphabet_size) letter counts over the candidates
+
+    Returns:
+        Row index of the best candidate (first one on ties), -1 if empty
+    """
+    n, length = codes.shape
+    best = -1
+    best_score = -1.0
+    for w in range(n):
+        total = 0
+        for p in range(length):
+            total += freq[p, codes[w, p]]
+
+        # Bonus for unique letters: popcount of the presence mask
+        bits = masks[w]
+        unique = 0
+        while bits:
+            bits &= bits - np.uint64(1)
+            unique += 1
+
+        score = total + unique * 0.1
+        if score > best_score:
+            best_score = score
+            best = w
+
+    return best
+
+
+@njit(parallel=True)
+def _filter_frequencies_parallel(
+    codes: np.ndarray,
+    masks: np.ndarray,
+    ids: np.ndarray,
+    required: np.uint64,
+    forbidden: np.uint64,
+    green_pos: np.ndarray,
+    green_code: np.ndarray,
+    wrong_pos: np.ndarray,
+    wrong_code: np.ndarray,
+    alphabet_size: int,
+    n_chunks: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Filter candidate ids and count survivor letters, one chunk per thread.
+
+    Args:
+        codes: (N, word_length) letter codes of the dictionary
+        masks: (N,) presence masks of the dictionary
+        ids: Candidate rows to test
+        required: Mask of letters every word must contain
+        forbidden: Mask of letters no word may contain
+        green_pos, green_code: Positions that must hold the given letter
+        wrong_pos, wrong_code: Positions that must not hold the given letter
+        alphabet_size: Number of distinct letter codes
+        n_chunks: Number of chunks the candidates are split into
+
+    Returns:
+        (keep, freq): bool mask over ids, and the (word_length, alphabet_size)
+        letter counts of the survivors
+    """
+    n = ids.shape[0]
+    length = codes.shape[1]
+    keep = np.zeros(n, dtype=np.bool_)
+    # Each chunk counts into its own table so threads never share a counter
+    freq_local = np.zeros((n_chunks, length, alphabet_size), dtype=np.int32)
+    chunk = (n + n_chunks - 1) // n_chunks
+
+    for c in prange(n_chunks):
+        for i in range(c * chunk, min(n, (c + 1) * chunk)):
+            w = ids[i]
+            m = masks[w]
+            if (m & required) != required or (m & forbidden) != 0:
+                continue
+
+            ok = True
+            for k in range(green_pos.shape[0]):
+                if codes[w, green_pos[k]] != green_code[k]:
+                    ok = False
+                    break
+            for k in range(wrong_pos.shape[0]):
+                if not ok:
+                    break
+                if codes[w, wrong_pos[k]] == wrong_code[k]:
+                    ok = False
+
+            if ok:
+                keep[i] = True
+                for p in range(length):
+                    freq_local[c, p, codes[w, p]] += 1
+
+    return keep, freq_local.sum(axis=0)
 
 
 class WordleCSPSolver:
@@ -21,18 +249,59 @@ class WordleCSPSolver:
     Uses OR-Tools CP-SAT to find words matching all constraints.
     """
 
-    def __init__(self, word_length: int = 5, dictionary: List[str] = None):
+    def __init__(
+        self,
+        word_length: int = 5,
+        dictionary: List[str] = None,
+        encoded: Optional[Tuple[Dict[str, int], np.ndarray, np.ndarray]] = None
+    ):
         """
         Initialize the Wordle CSP solver.
 
         Args:
             word_length: Length of words to solve for (default 5)
             dictionary: List of valid words
+            encoded: Precomputed encode_words() arrays for the dictionary's
+                distinct words (e.g. DictionaryManager.get_words_array()),
+                shared instead of re-encoded
+
+        Words that are not word_length letters long can never be the answer
+        and are left out of the candidate pool. Dictionaries with more
+        distinct letters than the packed encoding holds (64) are filtered
+        by checking the words themselves.
         """
         self.word_length = word_length
         self.dictionary = dictionary or []
         self.constraints = []
-        self.possible_words = set(self.dictionary)
+
+        # Each distinct word gets an integer id; the candidate pool is a boolean
+        # mask over ids, aligned with the packed _word_codes/_letter_masks rows
+        self.id_to_word: List[str] = [word for word in dict.fromkeys(self.dictionary) if len(word) == word_length]
+        self.word_to_id: Dict[str, int] = {word: i for i, word in enumerate(self.id_to_word)}
+        if encoded is None:
+            try:
+                encoded = get_encoded_dictionary(tuple(self.id_to_word), word_length)
+            except ValueError:
+                # Alphabet too large for the presence masks: constraints are
+                # checked on the words themselves (_letter_index is None)
+                encoded = (None, None, None)
+        self._letter_index, self._word_codes, self._letter_masks = encoded
+        # Initial pool, restored by reset() without rebuilding anything
+        self._initial_alive = np.ones(len(self.id_to_word), dtype=bool)
+        self._all_ids = np.arange(len(self.id_to_word))
+        self.alive = self._initial_alive.copy()
+        # Ids where alive is True, ascending; filters only ever touch these
+        # rows and replace (never mutate) the array, so it can alias _all_ids
+        self._alive_ids = self._all_ids
+        self._word_bytes: List[bytes] = (
+            [row.tobytes() for row in self._word_codes] if self._word_codes is not None else []
+        )
+
+        # Bumped whenever alive changes; keys the cached max_info suggestion
+        self._alive_version = 0
+        self._max_info_cache: Optional[Tuple[int, str]] = None
+        # max_info suggestion for the full dictionary, kept across resets
+        self._initial_best: Optional[str] = None
 
         # Track letter information
         self.correct_positions: Dict[int, str] = {}  # position -> letter
@@ -52,82 +321,357 @@ class WordleCSPSolver:
             raise ValueError(f"Guess and feedback must be of length {self.word_length}")
 
         # First pass: identify all CORRECT and PRESENT letters in this guess
-        letters_in_word = set()
-        for i, (letter, fb) in enumerate(zip(guess, feedback)):
-            if fb == Feedback.CORRECT or fb == Feedback.PRESENT:
-                letters_in_word.add(letter)
+        letters_in_word = {
+            letter for letter, fb in zip(guess, feedback)
+            if fb == Feedback.CORRECT or fb == Feedback.PRESENT
+        }
+
+        # Constraints learned from this guess only; earlier ones are already
+        # reflected in the surviving words
+        delta = {
+            "correct_positions": {},
+            "present_letters": set(),
+            "absent_letters": set(),
+            "wrong_positions": {},
+        }
 
         # Second pass: apply constraints
         for i, (letter, fb) in enumerate(zip(guess, feedback)):
             if fb == Feedback.CORRECT:
                 self.correct_positions[i] = letter
                 self.present_letters.add(letter)
+                delta["correct_positions"][i] = letter
+                delta["present_letters"].add(letter)
 
             elif fb == Feedback.PRESENT:
                 self.present_letters.add(letter)
                 if letter not in self.wrong_positions:
                     self.wrong_positions[letter] = set()
                 self.wrong_positions[letter].add(i)
+                delta["present_letters"].add(letter)
+                delta["wrong_positions"].setdefault(letter, set()).add(i)
 
             elif fb == Feedback.ABSENT:
                 # Only mark as absent if it's not present/correct elsewhere in THIS guess
                 # This handles duplicate letters correctly
                 if letter not in letters_in_word:
                     self.absent_letters.add(letter)
+                    delta["absent_letters"].add(letter)
+
+        self._apply_constraints(delta)
+
+    def _apply_constraints(self, delta: Optional[Dict] = None) -> None:
+        """
+        Apply constraints to filter possible words.
+
+        Constraints only ever tighten, so the surviving words already satisfy
+        every earlier constraint and only newly learned ones need checking.
+
+        Args:
+            delta: Constraints to apply, keyed like the solver attributes
+                (correct_positions, present_letters, absent_letters,
+                wrong_positions). Applies all current constraints if None.
+        """
+        if delta is None:
+            delta = {
+                "correct_positions": self.correct_positions,
+                "present_letters": self.present_letters,
+                "absent_letters": self.absent_letters,
+                "wrong_positions": self.wrong_positions,
+            }
+
+        alive = self.alive
+        letter_index = self._letter_index
+        self._alive_version += 1
+        required_letters = delta["present_letters"] | set(delta["correct_positions"].values())
+
+        if letter_index is None:
+            # No packed encoding (see __init__): check the words themselves
+            survivors = [
+                i for i in self._alive_ids.tolist()
+                if self._satisfies_constraints(
+                    self.id_to_word[i], delta["correct_positions"], required_letters,
+                    delta["absent_letters"], delta["wrong_positions"]
+                )
+            ]
+            self._set_alive_ids(np.array(survivors, dtype=self._alive_ids.dtype))
+            return
+
+        # A required letter that no dictionary word contains rules out every word
+        if any(letter not in letter_index for letter in required_letters):
+            alive[:] = False
+            self._alive_ids = self._alive_ids[:0]
+            return
+
+        if filter_and_score is not None:
+            self._apply_with_kernel(delta, required_letters)
+            return
+
+        ids = self._alive_ids
+
+        if NUMBA_AVAILABLE and len(ids) >= _PARALLEL_POOL:
+            self._apply_parallel(delta, required_letters)
+            return
+
+        if len(ids) <= _SMALL_POOL:
+            # NumPy call overhead dominates on a handful of words
+            correct_codes = {pos: letter_index[letter] for pos, letter in delta["correct_positions"].items()}
+            present_codes = {letter_index[letter] for letter in required_letters}
+            absent_codes = {letter_index[letter] for letter in delta["absent_letters"] if letter in letter_index}
+            wrong_codes = {
+                letter_index[letter]: positions
+                for letter, positions in delta["wrong_positions"].items()
+                if letter in letter_index
+            }
+            survivors = [
+                i for i in ids.tolist()
+                if self._satisfies_constraints(
+                    self._word_bytes[i], correct_codes, present_codes, absent_codes, wrong_codes
+                )
+            ]
+            self._set_alive_ids(np.array(survivors, dtype=ids.dtype))
+            return
+
+        required_mask = self._letters_to_mask(required_letters)
+        forbidden_mask = self._letters_to_mask(
+            letter for letter in delta["absent_letters"] if letter in letter_index
+        )
+
+        # Bloom-style prefilter: letter presence is a single AND per word
+        masks = self._letter_masks[ids]
+        keep = (masks & required_mask) == required_mask
+        keep &= (masks & forbidden_mask) == 0
+        ids = ids[keep]
+
+        # Positional checks only run on the words that passed the prefilter
+        if delta["correct_positions"] or delta["wrong_positions"]:
+            codes = self._word_codes[ids]
+            keep = np.ones(len(ids), dtype=bool)
+
+            for pos, letter in delta["correct_positions"].items():
+                keep &= codes[:, pos] == letter_index[letter]
+
+            for letter, positions in delta["wrong_positions"].items():
+                if letter not in letter_index:
+                    continue
+                for pos in positions:
+                    keep &= codes[:, pos] != letter_index[letter]
+
+            ids = ids[keep]
+
+        self._set_alive_ids(ids)
+
+    def _set_alive_ids(self, ids: np.ndarray) -> None:
+        """
+        Shrink the candidate pool to the given subset of the alive ids.
+
+        Only rows that were alive are cleared, so the cost is proportional to
+        the current pool rather than the dictionary.
+
+        Args:
+            ids: Surviving ids, ascending
+        """
+        self.alive[self._alive_ids] = False
+        self.alive[ids] = True
+        self._alive_ids = ids
 
-        self._apply_constraints()
+    def _apply_with_kernel(self, delta: Dict, required_letters: Set[str]) -> None:
+        """
+        Filter with the compiled kernel, which also scores the survivors.
 
-    def _apply_constraints(self) -> None:
-        """Apply all constraints to filter possible words."""
-        filtered_words = set()
+        The kernel's best word is what max_info would return for the new pool,
+        so it is stored as the cached suggestion.
 
-        for word in self.possible_words:
-            if self._satisfies_constraints(word):
-                filtered_words.add(word)
+        Args:
+            delta: Constraints to apply (see _apply_constraints)
+            required_letters: Letters every word must contain, all in the alphabet
+        """
+        required, forbidden, green_pos, green_code, wrong_pos, wrong_code = \
+            self._constraint_arrays(delta, required_letters)
+
+        ids = np.ascontiguousarray(self._alive_ids, dtype=np.intp)
+        survivors = np.empty_like(ids)
+        kept, best = filter_and_score(
+            self._word_codes,
+            self._letter_masks,
+            ids,
+            survivors,
+            int(required),
+            int(forbidden),
+            green_pos,
+            green_code,
+            wrong_pos,
+            wrong_code,
+            len(self._letter_index)
+        )
+        self._set_alive_ids(survivors[:kept])
+        self._max_info_cache = (self._alive_version, self.id_to_word[best] if best >= 0 else None)
+
+    def _apply_parallel(self, delta: Dict, required_letters: Set[str]) -> None:
+        """
+        Filter a large pool with the parallel Numba kernel.
 
-        self.possible_words = filtered_words
+        The kernel also returns the letter counts of the survivors, so the
+        max_info suggestion is scored right away and cached.
 
-    def _satisfies_constraints(self, word: str) -> bool:
+        Args:
+            delta: Constraints to apply (see _apply_constraints)
+            required_letters: Letters every word must contain, all in the alphabet
         """
-        Check if a word satisfies all current constraints.
+        ids = self._alive_ids
+        keep, freq = _filter_frequencies_parallel(
+            self._word_codes,
+            self._letter_masks,
+            ids,
+            *self._constraint_arrays(delta, required_letters),
+            len(self._letter_index),
+            get_num_threads()
+        )
+        ids = ids[keep]
+        self._set_alive_ids(ids)
+
+        best = _max_information_index(self._word_codes[ids], self._letter_masks[ids], freq)
+        self._max_info_cache = (self._alive_version, self.id_to_word[ids[best]] if best >= 0 else None)
+
+    def _constraint_arrays(self, delta: Dict, required_letters: Set[str]) -> Tuple:
+        """
+        Encode constraints as the flat masks and arrays the kernels take.
 
         Args:
-            word: Word to check
+            delta: Constraints to apply (see _apply_constraints)
+            required_letters: Letters every word must contain, all in the alphabet
+
+        Returns:
+            (required, forbidden, green_pos, green_code, wrong_pos, wrong_code)
+        """
+        letter_index = self._letter_index
+        green = list(delta["correct_positions"].items())
+        wrong = [
+            (pos, letter)
+            for letter, positions in delta["wrong_positions"].items()
+            if letter in letter_index
+            for pos in positions
+        ]
+
+        return (
+            self._letters_to_mask(required_letters),
+            self._letters_to_mask(
+                letter for letter in delta["absent_letters"] if letter in letter_index
+            ),
+            np.array([pos for pos, _ in green], dtype=np.int32),
+            np.array([letter_index[letter] for _, letter in green], dtype=np.uint8),
+            np.array([pos for pos, _ in wrong], dtype=np.int32),
+            np.array([letter_index[letter] for _, letter in wrong], dtype=np.uint8),
+        )
+
+    def _letters_to_mask(self, letters: Iterable[str]) -> np.uint64:
+        """
+        Build the presence bitmask for a set of known letters.
+
+        Args:
+            letters: Letters present in the encoded alphabet
+
+        Returns:
+            Bitmask with one bit set per letter
+        """
+        mask = 0
+        for letter in letters:
+            mask |= 1 << self._letter_index[letter]
+        return np.uint64(mask)
+
+    @property
+    def possible_words(self) -> Set[str]:
+        """Set of words that satisfy all current constraints."""
+        return {self.id_to_word[i] for i in self._alive_ids.tolist()}
+
+    def _satisfies_constraints(
+        self,
+        codes: Union[bytes, str],
+        correct_codes: Dict[int, int],
+        present_codes: Set[int],
+        absent_codes: Set[int],
+        wrong_codes: Dict[int, Set[int]]
+    ) -> bool:
+        """
+        Check if a word satisfies the given constraints.
+
+        Works on letter codes: indexing bytes yields an int, so no
+        one-character strings are allocated per check. A word and letters
+        can be passed instead of codes when there is no packed encoding.
+
+        Args:
+            codes: Letter codes of the word to check
+            correct_codes: position -> letter code
+            present_codes: Letter codes that must appear
+            absent_codes: Letter codes that must not appear
+            wrong_codes: letter code -> positions where it's not
 
         Returns:
             True if word satisfies all constraints
         """
         # Check correct positions
-        for pos, letter in self.correct_positions.items():
-            if word[pos] != letter:
+        for pos, code in correct_codes.items():
+            if codes[pos] != code:
                 return False
 
         # Check present letters are in the word
-        for letter in self.present_letters:
-            if letter not in word:
+        for code in present_codes:
+            if code not in codes:
                 return False
 
         # Check absent letters are not in the word
-        for letter in self.absent_letters:
-            if letter in word:
+        for code in absent_codes:
+            if code in codes:
                 return False
 
         # Check wrong positions
-        for letter, positions in self.wrong_positions.items():
+        for code, positions in wrong_codes.items():
             for pos in positions:
-                if word[pos] == letter:
+                if codes[pos] == code:
                     return False
 
         return True
 
-    def get_possible_words(self) -> List[str]:
+    def get_possible_words(self, sort: bool = True) -> List[str]:
         """
         Get all words that satisfy current constraints.
 
+        Args:
+            sort: Sort alphabetically (otherwise dictionary order)
+
         Returns:
             List of possible words
         """
-        return sorted(list(self.possible_words))
+        words = list(self.get_possible_words_iter())
+        return sorted(words) if sort else words
+
+    def get_possible_words_iter(self) -> Iterator[str]:
+        """
+        Iterate over words that satisfy current constraints, unsorted.
+
+        Returns:
+            Iterator over possible words in dictionary (id) order
+        """
+        return (self.id_to_word[i] for i in self._alive_ids.tolist())
+
+    @property
+    def initial_best_guess(self) -> Optional[str]:
+        """
+        max_info suggestion before any feedback, computed once per solver.
+
+        It only depends on the dictionary, so it can also be set from a
+        value persisted by an earlier run (see DictionaryManager.cache_first_guess).
+        """
+        if self._initial_best is None:
+            words = self.id_to_word
+            if len(words) <= 2:
+                return words[0] if words else None
+            self._initial_best = self._get_max_information_word(words)
+        return self._initial_best
+
+    @initial_best_guess.setter
+    def initial_best_guess(self, word: str) -> None:
+        self._initial_best = word
 
     def get_best_guess(self, strategy: str = "max_info") -> str:
         """
@@ -139,17 +683,33 @@ class WordleCSPSolver:
         Returns:
             Best word to guess
         """
-        possible = self.get_possible_words()
+        # Dictionary order is enough for scoring: ties resolve by word id
+        possible = list(self.get_possible_words_iter())
 
         if not possible:
             return None
 
-        if strategy == "first" or len(possible) == 1:
+        if len(possible) == 1:
             return possible[0]
 
+        if strategy == "first":
+            return min(possible)
+
         elif strategy == "max_info":
-            # Use information theory to find word that eliminates most candidates
-            return self._get_max_information_word(possible)
+            if len(possible) == 2:
+                # Either word settles the game next turn; no scoring needed
+                return possible[0]
+
+            if self._alive_ids is self._all_ids:
+                # Untouched pool (new game or after reset)
+                return self.initial_best_guess
+
+            # Use information theory to find word that eliminates most candidates.
+            # The result only depends on the candidate pool, so repeated queries
+            # between two feedbacks reuse it.
+            if self._max_info_cache is None or self._max_info_cache[0] != self._alive_version:
+                self._max_info_cache = (self._alive_version, self._get_max_information_word(possible))
+            return self._max_info_cache[1]
 
         else:
             import random
@@ -166,7 +726,27 @@ class WordleCSPSolver:
         Returns:
             Word with maximum expected information
         """
-        # Count letter frequencies in remaining words
+        if not candidates:
+            return None
+
+        if (
+            self._word_codes is not None
+            and len(candidates) > _SMALL_SCORING_POOL
+            and all(word in self.word_to_id for word in candidates)
+        ):
+            ids = np.fromiter((self.word_to_id[word] for word in candidates), dtype=np.intp, count=len(candidates))
+            codes = self._word_codes[ids]
+            masks = self._letter_masks[ids]
+            freq = _position_frequencies(codes, len(self._letter_index))
+            if NUMBA_AVAILABLE:
+                best = _max_information_index(codes, masks, freq)
+            else:
+                # argmax keeps the first candidate on ties
+                best = int(np.argmax(_frequency_scores(codes, masks, freq)))
+            return candidates[best]
+
+        # Small pools (NumPy setup cost dominates) and words outside the
+        # dictionary: count letter frequencies in remaining words
         letter_freq: Dict[Tuple[int, str], int] = {}
 
         for word in candidates:
@@ -195,7 +775,9 @@ class WordleCSPSolver:
     def reset(self) -> None:
         """Reset all constraints and start fresh."""
         self.constraints = []
-        self.possible_words = set(self.dictionary)
+        np.copyto(self.alive, self._initial_alive)
+        self._alive_ids = self._all_ids
+        self._alive_version += 1
         self.correct_positions = {}
         self.present_letters = set()
         self.absent_letters = set()
@@ -208,11 +790,12 @@ class WordleCSPSolver:
         Returns:
             Dictionary with solver stats
         """
+        possible_count = len(self._alive_ids)
         return {
             "total_words": len(self.dictionary),
-            "possible_words": len(self.possible_words),
+            "possible_words": possible_count,
             "correct_positions": len(self.correct_positions),
             "present_letters": len(self.present_letters),
             "absent_letters": len(self.absent_letters),
-            "elimination_rate": 1 - (len(self.possible_words) / len(self.dictionary)) if self.dictionary else 0
+            "elimination_rate": 1 - (possible_count / len(self.dictionary)) if self.dictionary else 0
         }
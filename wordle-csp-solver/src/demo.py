@@ -50,6 +50,57 @@ from colorama import Fore, Style, init
 
 init(autoreset=True)
 
+# Terminal color of each feedback type
+FEEDBACK_COLOR = {
+    Feedback.CORRECT: Fore.GREEN,
+    Feedback.PRESENT: Fore.YELLOW,
+    Feedback.ABSENT: Fore.WHITE,
+}
+
+
+def get_feedback(guess: str, secret: str) -> list:
+    """
+    Compute Wordle feedback for a guess against the secret word.
+
+    Both words are packed into integers, one byte per letter: XOR-ing them
+    zeroes the byte lanes where the letters match, and the zero lanes are
+    detected for all positions at once with SWAR bit tricks. Yellows are then
+    resolved against a byte histogram of the secret's non-green letters.
+
+    Args:
+        guess: The guessed word (lowercase ASCII)
+        secret: The secret word
+
+    Returns:
+        List of Feedback (one per letter)
+    """
+    g = guess.encode('ascii')
+    s = secret.lower().encode('ascii')
+    n = len(g)
+    low7 = int.from_bytes(b'\x7f' * n, 'little')
+    high = int.from_bytes(b'\x80' * n, 'little')
+
+    diff = int.from_bytes(g, 'little') ^ int.from_bytes(s, 'little')
+    # High bit of a lane is set iff that lane of diff is zero (exact, no borrow)
+    green = ~(((diff & low7) + low7) | diff | low7) & high
+
+    remaining = bytearray(256)
+    for i in range(n):
+        if not (green >> (8 * i + 7)) & 1:
+            remaining[s[i]] += 1
+
+    feedback = []
+    for i in range(n):
+        if (green >> (8 * i + 7)) & 1:
+            feedback.append(Feedback.CORRECT)
+        elif remaining[g[i]]:
+            remaining[g[i]] -= 1
+            feedback.append(Feedback.PRESENT)
+        else:
+            feedback.append(Feedback.ABSENT)
+
+    return feedback
+
 
 def demo_basic_solving():
     """
@@ -80,14 +131,7 @@ def demo_basic_solving():
         print(f"{Fore.CYAN}Tentative {i}: {guess.upper()}{Style.RESET_ALL}")
 
         # Display feedback
-        display = ""
-        for letter, fb in zip(guess.upper(), feedback):
-            if fb == Feedback.CORRECT:
-                display += f"{Fore.GREEN}█{Style.RESET_ALL}"
-            elif fb == Feedback.PRESENT:
-                display += f"{Fore.YELLOW}█{Style.RESET_ALL}"
-            else:
-                display += f"{Fore.WHITE}█{Style.RESET_ALL}"
+        display = "".join(f"{FEEDBACK_COLOR[fb]}█" for fb in feedback) + Style.RESET_ALL
 
         print(f"Feedback: {display}")
 
@@ -291,29 +335,16 @@ def demo_full_game():
 
     dict_manager = DictionaryManager(word_length=5)
     dict_manager.load_default_english()
-    solver = WordleCSPSolver(5, dict_manager.get_words())
-    optimizer = WordleOptimizer(dict_manager.get_words())
+    # Solver and optimizer share one packed encoding of the dictionary
+    words = dict_manager.get_words()
+    encoded = dict_manager.get_words_array()
+    solver = WordleCSPSolver(5, words, encoded)
+    optimizer = WordleOptimizer(words, encoded)
 
     secret = "CRANE"
     print(f"{Fore.YELLOW}Mot secret: {secret}{Style.RESET_ALL}")
     print(f"Objectif: Trouver le mot en minimum de tentatives\n")
 
-    def get_feedback(guess, secret):
-        feedback = [Feedback.ABSENT] * 5
-        secret_chars = list(secret.lower())
-
-        for i, (g, s) in enumerate(zip(guess, secret.lower())):
-            if g == s:
-                feedback[i] = Feedback.CORRECT
-                secret_chars[i] = None
-
-        for i, char in enumerate(guess):
-            if feedback[i] == Feedback.ABSENT and char in secret_chars:
-                feedback[i] = Feedback.PRESENT
-                secret_chars[secret_chars.index(char)] = None
-
-        return feedback
-
     attempt = 0
     max_attempts = 6
 
@@ -322,7 +353,7 @@ def demo_full_game():
 
         # Get best guess
         if attempt == 1:
-            guess = optimizer.get_strategic_first_guess(dict_manager.get_words())
+            guess = optimizer.get_strategic_first_guess(words)
         else:
             guess = solver.get_best_guess(strategy="max_info")
 
@@ -335,14 +366,9 @@ def demo_full_game():
         # Display
         print(f"{Fore.CYAN}Tentative {attempt}:{Style.RESET_ALL} {guess.upper()}")
 
-        display = ""
-        for letter, fb in zip(guess.upper(), feedback):
-            if fb == Feedback.CORRECT:
-                display += f"{Fore.GREEN}{letter}{Style.RESET_ALL} "
-            elif fb == Feedback.PRESENT:
-                display += f"{Fore.YELLOW}{letter}{Style.RESET_ALL} "
-            else:
-                display += f"{Fore.WHITE}{letter}{Style.RESET_ALL} "
+        display = " ".join(
+            f"{FEEDBACK_COLOR[fb]}{letter}" for letter, fb in zip(guess.upper(), feedback)
+        ) + Style.RESET_ALL
 
         print(f"Feedback: {display}")
 
@@ -3,8 +3,89 @@ Dictionary Manager for loading and managing word lists.
 Supports both French and English dictionaries.
 """
 
+import mmap
 import os
-from typing import List, Set
+import pickle
+import sys
+from functools import lru_cache
+from typing import List, Set, Dict, Tuple, Optional
+
+import numpy as np
+
+# Directory of this module, base for relative dictionary paths
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Format of the cache files written next to dictionaries; bump it whenever
+# their content changes so files left by older versions are ignored
+_CACHE_VERSION = 1
+
+
+def encode_words(words: List[str], word_length: int) -> Tuple[Dict[str, int], np.ndarray, np.ndarray]:
+    """
+    Pack a word list into a structure-of-arrays layout shared by the solver
+    and the optimizer.
+
+    Each distinct character of the word list gets a small integer code, so
+    mixed-case or accented dictionaries are handled the same way as a-z.
+
+    Args:
+        words: Words to encode (all of length word_length)
+        word_length: Length of every word
+
+    Returns:
+        Tuple of (letter -> code map, (N, word_length) uint8 letter codes,
+        (N,) uint64 presence masks with bit `code` set for each letter in the word)
+
+    Raises:
+        ValueError: If a word is not word_length long, or the words use more
+            than 64 distinct letters (one presence-mask bit each). Callers
+            fall back to working on the strings (see WordleCSPSolver and
+            WordleOptimizer).
+    """
+    if any(len(word) != word_length for word in words):
+        raise ValueError(f"All words must be of length {word_length}")
+
+    # UTF-32 gives one fixed-width code point per character
+    points = np.frombuffer(''.join(words).encode('utf-32-le'), dtype=np.uint32)
+    alphabet, codes = np.unique(points, return_inverse=True)
+    if len(alphabet) > 64:
+        raise ValueError(f"Words use {len(alphabet)} distinct letters (max 64)")
+
+    letter_index = {chr(point): code for code, point in enumerate(alphabet.tolist())}
+    codes = codes.astype(np.uint8).reshape(len(words), word_length)
+
+    masks = np.zeros(len(words), dtype=np.uint64)
+    for pos in range(word_length):
+        masks |= np.left_shift(np.uint64(1), codes[:, pos].astype(np.uint64))
+
+    return letter_index, codes, masks
+
+
+@lru_cache(maxsize=8)
+def get_encoded_dictionary(
+    words: Tuple[str, ...],
+    word_length: int
+) -> Tuple[Dict[str, int], np.ndarray, np.ndarray]:
+    """
+    Memoized encode_words(), so every solver and optimizer built over the
+    same word list shares one set of arrays.
+
+    The arrays are returned read-only since all callers hold the same objects.
+
+    Args:
+        words: Words to encode, as a tuple so the list can be a cache key
+        word_length: Length of every word
+
+    Returns:
+        Same as encode_words()
+
+    Raises:
+        ValueError: Same as encode_words()
+    """
+    letter_index, codes, masks = encode_words(list(words), word_length)
+    codes.setflags(write=False)
+    masks.setflags(write=False)
+    return letter_index, codes, masks
 
 
 class DictionaryManager:
@@ -19,110 +100,93 @@ class DictionaryManager:
         """
         self.word_length = word_length
         self.words: Set[str] = set()
+        # File the current words were loaded from, None if they came from several sources
+        self.source_path: Optional[str] = None
+        self._sorted_words: Optional[Tuple[str, ...]] = None
+        self._encoded: Optional[Tuple[Dict[str, int], np.ndarray, np.ndarray]] = None
+
+    def _invalidate_caches(self) -> None:
+        """Drop the views derived from the word set after it changes."""
+        self._sorted_words = None
+        self._encoded = None
 
     def load_from_file(self, filepath: str) -> None:
         """
         Load words from a text file (one word per line).
         Resolves relative paths relative to the module's directory.
 
+        The parsed words are pickled next to the file and reused on later
+        loads until the text file is modified again. Loading a pickle can run
+        arbitrary code, so the cache is only as trustworthy as the directory
+        holding the dictionary: do not load word lists from directories that
+        other users can write to.
+
         Args:
             filepath: Path to dictionary file (absolute or relative to src/ directory)
         """
-        # If filepath is relative, resolve it relative to the src/ directory
+        # If filepath is relative, resolve it relative to the src/ directory.
+        # A missing file raises FileNotFoundError when it is opened.
         if not os.path.isabs(filepath):
-            module_dir = os.path.dirname(os.path.abspath(__file__))
-            filepath = os.path.join(module_dir, filepath)
-        
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(f"Dictionary file not found: {filepath}")
-
-        with open(filepath, 'r', encoding='utf-8') as f:
-            for line in f:
-                word = line.strip().lower()
-                if len(word) == self.word_length and word.isalpha():
-                    self.words.add(word)
+            filepath = os.path.join(_MODULE_DIR, filepath)
+
+        cache_path = f"{filepath}.L{self.word_length}.v{_CACHE_VERSION}.pkl"
+
+        words = None
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(filepath):
+                with open(cache_path, 'rb') as f:
+                    words = pickle.load(f)
+        except (OSError, EOFError, ValueError, AttributeError, pickle.UnpicklingError):
+            # Missing, unreadable or truncated cache: parse the text file
+            words = None
+        if not isinstance(words, set):
+            words = None
+
+        if words is None:
+            words = self._parse_file(filepath)
+            try:
+                with open(cache_path, 'wb') as f:
+                    pickle.dump(words, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except OSError:
+                # Read-only location: the cache is only an optimization
+                pass
+
+        # Interned so the solver, optimizer and history all share one string per word
+        self._invalidate_caches()
+        self.source_path = filepath if not self.words else None
+        self.words.update(map(sys.intern, words))
+
+    def _parse_file(self, filepath: str) -> Set[str]:
+        """
+        Parse the valid words of a dictionary text file.
+
+        Args:
+            filepath: Absolute path to the dictionary file
+
+        Returns:
+            Set of lowercase words of the right length
+        """
+        # Decode straight from a read-only mapping of the file, skipping the
+        # copy through a read buffer (mmap rejects empty files)
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return set()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = str(mm, 'utf-8').lower().split()
+
+        # One word per line: a whitespace split of the whole file yields them stripped
+        length = self.word_length
+        return {word for word in data if len(word) == length and word.isalpha()}
 
     def load_default_english(self) -> None:
         """Load default English word list."""
-        # Common 5-letter English words for Wordle
-        common_words = [
-            "about", "above", "abuse", "actor", "acute", "admit", "adopt", "adult", "after", "again",
-            "agent", "agree", "ahead", "alarm", "album", "alert", "align", "alike", "alive", "allow",
-            "alone", "along", "alter", "among", "anger", "angle", "angry", "apart", "apple", "apply",
-            "arena", "argue", "arise", "array", "aside", "asset", "audio", "audit", "avoid", "award",
-            "aware", "badly", "baker", "bases", "basic", "basis", "beach", "began", "begin", "begun",
-            "being", "below", "bench", "billy", "birth", "black", "blade", "blame", "blind", "block",
-            "blood", "board", "boost", "booth", "bound", "brain", "brand", "bread", "break", "breed",
-            "brief", "bring", "broad", "broke", "brown", "build", "built", "buyer", "cable", "calif",
-            "carry", "catch", "cause", "chain", "chair", "chart", "chase", "cheap", "check", "chest",
-            "chief", "child", "china", "chose", "civil", "claim", "class", "clean", "clear", "click",
-            "clock", "close", "coach", "coast", "could", "count", "court", "cover", "crack", "craft",
-            "crash", "crazy", "cream", "crime", "cross", "crowd", "crown", "crude", "curve", "cycle",
-            "daily", "dance", "dated", "dealt", "death", "debut", "delay", "depth", "doing", "doubt",
-            "dozen", "draft", "drama", "drank", "drawn", "dream", "dress", "drill", "drink", "drive",
-            "drove", "dying", "eager", "early", "earth", "eight", "elite", "empty", "enemy", "enjoy",
-            "enter", "entry", "equal", "error", "event", "every", "exact", "exist", "extra", "faith",
-            "false", "fault", "fiber", "field", "fifth", "fifty", "fight", "final", "first", "fixed",
-            "flash", "fleet", "floor", "fluid", "focus", "force", "forth", "forty", "forum", "found",
-            "frame", "frank", "fraud", "fresh", "front", "fruit", "fully", "funny", "giant", "given",
-            "glass", "globe", "going", "grace", "grade", "grand", "grant", "grass", "great", "green",
-            "gross", "group", "grown", "guard", "guess", "guest", "guide", "happy", "harry", "heart",
-            "heavy", "hence", "henry", "horse", "hotel", "house", "human", "ideal", "image", "index",
-            "inner", "input", "issue", "japan", "jimmy", "joint", "jones", "judge", "known", "label",
-            "large", "laser", "later", "laugh", "layer", "learn", "lease", "least", "leave", "legal",
-            "lemon", "level", "lewis", "light", "limit", "links", "lives", "local", "logic", "loose",
-            "lower", "lucky", "lunch", "lying", "magic", "major", "maker", "march", "maria", "match",
-            "maybe", "mayor", "meant", "media", "metal", "might", "minor", "minus", "mixed", "model",
-            "money", "month", "moral", "motor", "mount", "mouse", "mouth", "movie", "music", "needs",
-            "never", "newly", "night", "noise", "north", "noted", "novel", "nurse", "occur", "ocean",
-            "offer", "often", "order", "other", "ought", "paint", "panel", "paper", "party", "peace",
-            "peter", "phase", "phone", "photo", "piece", "pilot", "pitch", "place", "plain", "plane",
-            "plant", "plate", "point", "pound", "power", "press", "price", "pride", "prime", "print",
-            "prior", "prize", "proof", "proud", "prove", "queen", "quick", "quiet", "quite", "radio",
-            "raise", "range", "rapid", "ratio", "reach", "ready", "refer", "right", "rival", "river",
-            "robin", "roger", "roman", "rough", "round", "route", "royal", "rural", "scale", "scene",
-            "scope", "score", "sense", "serve", "seven", "shall", "shape", "share", "sharp", "sheet",
-            "shelf", "shell", "shift", "shine", "shirt", "shock", "shoot", "short", "shown", "sight",
-            "since", "sixth", "sixty", "sized", "skill", "sleep", "slide", "small", "smart", "smile",
-            "smith", "smoke", "solid", "solve", "sorry", "sound", "south", "space", "spare", "speak",
-            "speed", "spend", "spent", "split", "spoke", "sport", "staff", "stage", "stake", "stand",
-            "start", "state", "steam", "steel", "stick", "still", "stock", "stone", "stood", "store",
-            "storm", "story", "strip", "stuck", "study", "stuff", "style", "sugar", "suite", "super",
-            "sweet", "table", "taken", "taste", "taxes", "teach", "terry", "texas", "thank", "theft",
-            "their", "theme", "there", "these", "thick", "thing", "think", "third", "those", "three",
-            "threw", "throw", "tight", "times", "title", "today", "topic", "total", "touch", "tough",
-            "tower", "track", "trade", "train", "trait", "trend", "trial", "tribe", "trick", "tried",
-            "tries", "troop", "truck", "truly", "trust", "truth", "twice", "under", "undue", "union",
-            "unity", "until", "upper", "urban", "usage", "usual", "valid", "value", "video", "virus",
-            "visit", "vital", "vocal", "voice", "waste", "watch", "water", "wheel", "where", "which",
-            "while", "white", "whole", "whose", "woman", "women", "world", "worry", "worse", "worst",
-            "worth", "would", "wound", "write", "wrong", "wrote", "young", "youth", "crane"
-        ]
-
-        self.words = set(w for w in common_words if len(w) == self.word_length)
+        self.words = set()
+        self.load_from_file('../data/default_english.txt')
 
     def load_default_french(self) -> None:
         """Load default French word list."""
-        # Common 5-letter French words
-        french_words = [
-            "alors", "autre", "avant", "avoir", "blanc", "bonne", "carte", "cause", "cette", "celui",
-            "chose", "comme", "corps", "cours", "droit", "effet", "enfin", "entre", "faire", "femme",
-            "forme", "force", "grand", "groupe", "homme", "heure", "jamais", "jardin", "jeune", "jours",
-            "livre", "leurs", "ligne", "leur", "mieux", "monde", "moins", "morte", "place", "plus",
-            "point", "porte", "pour", "peuvent", "quand", "reste", "route", "sans", "seul", "sinon",
-            "sous", "temps", "terre", "toute", "train", "trois", "trouve", "ville", "voici", "voila",
-            "venir", "vivre", "vraie", "agent", "allez", "arbre", "avait", "belle", "boire", "brave",
-            "calme", "champ", "chaud", "coeur", "crois", "debut", "demain", "deux", "doigt", "droit",
-            "ecole", "eglise", "etait", "etant", "fille", "froid", "jaune", "juste", "aller", "lutte",
-            "madame", "maison", "matin", "merci", "monte", "noire", "notre", "ocean", "oncle", "ordre",
-            "parle", "parti", "passe", "pauvre", "pense", "peste", "petite", "piece", "poche", "porte",
-            "poste", "prise", "puits", "quart", "reine", "riche", "rouge", "russe", "saint", "salle",
-            "Seine", "serve", "seule", "signe", "sucre", "suite", "table", "tache", "tante", "tente",
-            "tombe", "total", "trous", "vague", "valse", "vaste", "venir", "verre", "verte", "vieux",
-            "vigne", "voire", "voisin", "votre", "wagon","fleur"
-        ]
-
-        self.words = set(w for w in french_words if len(w) == self.word_length)
+        self.words = set()
+        self.load_from_file('../data/default_french.txt')
 
     def add_words(self, words: List[str]) -> None:
         """
@@ -131,10 +195,73 @@ class DictionaryManager:
         Args:
             words: List of words to add
         """
-        for word in words:
-            word = word.lower().strip()
-            if len(word) == self.word_length and word.isalpha():
-                self.words.add(word)
+        self._invalidate_caches()
+        self.source_path = None
+        # Normalize and deduplicate first so each distinct word is validated once
+        length = self.word_length
+        cleaned = {word.lower().strip() for word in words}
+        self.words |= {sys.intern(word) for word in cleaned if len(word) == length and word.isalpha()}
+
+    def get_cached_first_guess(self, strategy: str) -> Optional[str]:
+        """
+        Get the opening guess stored by cache_first_guess() for this word list.
+
+        Args:
+            strategy: Solver strategy the guess was computed with
+
+        Returns:
+            Stored guess, or None if there is none, the file changed since or
+            the guess is not in the current word list
+        """
+        if self.source_path is None:
+            return None
+
+        guess = self._load_first_guesses().get(strategy)
+        # A guess left by another word list is not a valid opening
+        return guess if isinstance(guess, str) and guess in self.words else None
+
+    def cache_first_guess(self, strategy: str, word: Optional[str]) -> None:
+        """
+        Persist the opening guess for this word list next to its source file.
+
+        Only word lists loaded from a single file are cached.
+
+        Args:
+            strategy: Solver strategy the guess was computed with
+            word: Best first guess
+        """
+        if self.source_path is None or word is None:
+            return
+
+        guesses = self._load_first_guesses()
+        guesses[strategy] = word
+        try:
+            with open(self._first_guess_cache_path(), 'wb') as f:
+                pickle.dump(guesses, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            # Read-only location: the cache is only an optimization
+            pass
+
+    def _first_guess_cache_path(self) -> str:
+        """Path of the first-guess cache of the current source file."""
+        return f"{self.source_path}.L{self.word_length}.v{_CACHE_VERSION}.first.pkl"
+
+    def _load_first_guesses(self) -> Dict[str, str]:
+        """
+        Read the stored opening guesses of the current source file.
+
+        Returns:
+            Strategy -> guess map, empty if there is no up-to-date cache
+        """
+        cache_path = self._first_guess_cache_path()
+        try:
+            if os.path.getmtime(cache_path) < os.path.getmtime(self.source_path):
+                return {}
+            with open(cache_path, 'rb') as f:
+                guesses = pickle.load(f)
+        except (OSError, EOFError, ValueError, AttributeError, pickle.UnpicklingError):
+            return {}
+        return guesses if isinstance(guesses, dict) else {}
 
     def get_words(self) -> List[str]:
         """
@@ -143,7 +270,44 @@ class DictionaryManager:
         Returns:
             Sorted list of words
         """
-        return sorted(list(self.words))
+        return list(self._get_sorted_words())
+
+    def _get_sorted_words(self) -> Tuple[str, ...]:
+        """
+        Get the words in sorted order, sorted once per word list.
+
+        Returns:
+            Sorted tuple of words
+        """
+        if self._sorted_words is None:
+            self._sorted_words = tuple(sorted(self.words))
+        return self._sorted_words
+
+    def get_words_array(self) -> Tuple[Dict[str, int], np.ndarray, np.ndarray]:
+        """
+        Get the packed encoding of get_words(), built once per word list.
+
+        Pass it to WordleCSPSolver / WordleOptimizer together with
+        get_words() so they share the arrays instead of re-encoding.
+
+        Returns:
+            (letter -> code map, (N, word_length) uint8 codes, (N,) uint64 masks)
+        """
+        if self._encoded is None:
+            self._encoded = get_encoded_dictionary(self._get_sorted_words(), self.word_length)
+        return self._encoded
+
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the structure-of-arrays view of get_words() for vectorized filtering.
+
+        Returns:
+            ((N, word_length) uint8 letter codes, (N,) uint64 presence masks),
+            row i matching get_words()[i]; letter codes follow the map
+            returned by get_words_array()
+        """
+        _, codes, masks = self.get_words_array()
+        return codes, masks
 
     def contains(self, word: str) -> bool:
         """
@@ -3,21 +3,60 @@ Interactive CLI interface for Wordle CSP Solver.
 Provides user-friendly interaction with the solver.
 """
 
+from collections import Counter
 from typing import List, Optional
-from colorama import Fore, Back, Style, init
-from csp_solver import WordleCSPSolver, Feedback
-from dictionary_manager import DictionaryManager
-from llm_integration import WordleLLMAssistant
+from colorama import Fore, Back, Style, just_fix_windows_console
 
+try:
+    from .csp_solver import WordleCSPSolver, Feedback, encode_feedback
+    from .dictionary_manager import DictionaryManager
+    from .llm_integration import WordleLLMAssistant
+except ImportError:
+    from csp_solver import WordleCSPSolver, Feedback, encode_feedback
+    from dictionary_manager import DictionaryManager
+    from llm_integration import WordleLLMAssistant
 
-# Initialize colorama for cross-platform color support
-init(autoreset=True)
+
+# Terminals with native ANSI support (anything but legacy Windows consoles)
+# print colors as is; colorama only wraps stdout where it has to translate them
+just_fix_windows_console()
+
+# Colored tile template for each feedback type, filled with the letter
+_FMT = {
+    Feedback.CORRECT: f"{Back.GREEN}{Fore.BLACK} {{}} {Style.RESET_ALL}",
+    Feedback.PRESENT: f"{Back.YELLOW}{Fore.BLACK} {{}} {Style.RESET_ALL}",
+    Feedback.ABSENT: f"{Back.WHITE}{Fore.BLACK} {{}} {Style.RESET_ALL}",
+}
+
+# Feedback type of each character accepted in a feedback string
+_PARSE = {'G': Feedback.CORRECT, 'Y': Feedback.PRESENT, 'X': Feedback.ABSENT}
 
 
 class WordleGameInterface:
     """Interactive interface for playing and solving Wordle."""
 
-    def __init__(self, word_length: int = 5, language: str = "english", use_llm: bool = False):
+    # Per language: dictionary file tried first, built-in fallback loader,
+    # and how each of the two is described once loaded
+    _DICTIONARIES = {
+        "english": (
+            '../data/wordle_english_5letters.txt', "load_default_english",
+            "Dictionnaire anglais complet chargé", "Utilisation du dictionnaire anglais par défaut"
+        ),
+        "french": (
+            '../data/dictionnaire_francais_complet.txt', "load_default_french",
+            "Dictionnaire français personnalisé chargé", "Utilisation du dictionnaire français par défaut"
+        ),
+    }
+
+    def __init__(
+        self,
+        word_length: int = 5,
+        language: str = "english",
+        use_llm: bool = False,
+        dict_path: Optional[str] = None,
+        dict_manager: Optional[DictionaryManager] = None,
+        solver: Optional[WordleCSPSolver] = None
+    ):
         """
         Initialize game interface.
 
@@ -25,32 +64,36 @@ class WordleGameInterface:
             word_length: Length of words (default 5)
             language: Language for dictionary ("english" or "french")
             use_llm: Whether to use LLM assistance
+            dict_path: Dictionary file to load instead of the language's default file
+            dict_manager: Already loaded dictionary to use instead of loading one
+            solver: Solver to use instead of building one over the dictionary
         """
         self.word_length = word_length
         self.language = language
         self.use_llm = use_llm
 
         # Initialize dictionary
-        self.dict_manager = DictionaryManager(word_length)
-        # Essayer de charger depuis les fichiers, sinon utiliser les dictionnaires par défaut
-        if language.lower() == "french":
-            try:
-                self.dict_manager.load_from_file('../data/dictionnaire_francais_complet.txt')
-                print(f"✅ Dictionnaire français personnalisé chargé ({self.dict_manager.size()} mots)")
-            except FileNotFoundError:
-                self.dict_manager.load_default_french()
-                print(f"⚠️  Utilisation du dictionnaire français par défaut ({self.dict_manager.size()} mots)")
+        if dict_manager is None:
+            dict_manager = DictionaryManager(word_length)
+            self.dict_manager = dict_manager
+            self._load_dictionary(dict_path)
         else:
-            try:
-                self.dict_manager.load_from_file('../data/wordle_english_5letters.txt')
-                print(f"✅ Dictionnaire anglais complet chargé ({self.dict_manager.size()} mots)")
-            except FileNotFoundError:
-                self.dict_manager.load_default_english()
-                print(f"⚠️  Utilisation du dictionnaire anglais par défaut ({self.dict_manager.size()} mots)")
-
+            self.dict_manager = dict_manager
 
         # Initialize solver
-        self.solver = WordleCSPSolver(word_length, self.dict_manager.get_words())
+        self._first_guess_pending = False
+        if solver is None:
+            solver = WordleCSPSolver(word_length, dict_manager.get_words(), dict_manager.get_words_array())
+
+            # The opening suggestion only depends on the word list: reuse the
+            # one stored by an earlier run, or store it once max_info first
+            # computes it (see get_solver_suggestion)
+            first_guess = dict_manager.get_cached_first_guess("max_info")
+            if first_guess is not None:
+                solver.initial_best_guess = first_guess
+            else:
+                self._first_guess_pending = True
+        self.solver = solver
 
         # Initialize LLM if enabled
         self.llm_assistant = WordleLLMAssistant() if use_llm else None
@@ -58,23 +101,47 @@ class WordleGameInterface:
         self.attempts = []
         self.max_attempts = 6
 
+    def _load_dictionary(self, dict_path: Optional[str] = None) -> None:
+        """
+        Load the language's dictionary file, or its built-in list if the file is missing.
+
+        Args:
+            dict_path: Dictionary file to load instead of the language's default file
+        """
+        default_path, fallback, loaded_msg, fallback_msg = self._DICTIONARIES.get(
+            self.language.lower(), self._DICTIONARIES["english"]
+        )
+
+        # Essayer de charger depuis le fichier, sinon utiliser le dictionnaire par défaut
+        try:
+            self.dict_manager.load_from_file(dict_path or default_path)
+            print(f"✅ {loaded_msg} ({self.dict_manager.size()} mots)")
+        except FileNotFoundError:
+            getattr(self.dict_manager, fallback)()
+            print(f"⚠️  {fallback_msg} ({self.dict_manager.size()} mots)")
+
     def print_header(self) -> None:
         """Print game header."""
-        print("\n" + "=" * 50)
-        print(f"{Fore.CYAN}{Style.BRIGHT}WORDLE CSP SOLVER{Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}Constraint Satisfaction Problem Approach{Style.RESET_ALL}")
+        lines = [
+            "\n" + "=" * 50,
+            f"{Fore.CYAN}{Style.BRIGHT}WORDLE CSP SOLVER{Style.RESET_ALL}",
+            f"{Fore.YELLOW}Constraint Satisfaction Problem Approach{Style.RESET_ALL}",
+        ]
         if self.use_llm:
-            print(f"{Fore.MAGENTA}🤖 LLM-Enhanced Mode{Style.RESET_ALL}")
-        print("=" * 50 + "\n")
+            lines.append(f"{Fore.MAGENTA}🤖 LLM-Enhanced Mode{Style.RESET_ALL}")
+        lines.append("=" * 50 + "\n")
+        print("\n".join(lines))
 
     def print_instructions(self) -> None:
         """Print game instructions."""
-        print(f"{Fore.CYAN}Instructions:{Style.RESET_ALL}")
-        print(f"  {Back.GREEN}{Fore.BLACK} G {Style.RESET_ALL} = Green (Correct letter, correct position)")
-        print(f"  {Back.YELLOW}{Fore.BLACK} Y {Style.RESET_ALL} = Yellow (Correct letter, wrong position)")
-        print(f"  {Back.WHITE}{Fore.BLACK} X {Style.RESET_ALL} = Gray (Letter not in word)")
-        print(f"\nEnter feedback as: {Fore.GREEN}GGYXX{Style.RESET_ALL} (5 characters: G, Y, or X)")
-        print(f"Type '{Fore.RED}quit{Style.RESET_ALL}' to exit\n")
+        print("\n".join([
+            f"{Fore.CYAN}Instructions:{Style.RESET_ALL}",
+            f"  {Back.GREEN}{Fore.BLACK} G {Style.RESET_ALL} = Green (Correct letter, correct position)",
+            f"  {Back.YELLOW}{Fore.BLACK} Y {Style.RESET_ALL} = Yellow (Correct letter, wrong position)",
+            f"  {Back.WHITE}{Fore.BLACK} X {Style.RESET_ALL} = Gray (Letter not in word)",
+            f"\nEnter feedback as: {Fore.GREEN}GGYXX{Style.RESET_ALL} (5 characters: G, Y, or X)",
+            f"Type '{Fore.RED}quit{Style.RESET_ALL}' to exit\n",
+        ]))
 
     def display_word_colored(self, word: str, feedback: List[Feedback]) -> str:
         """
@@ -87,15 +154,7 @@ class WordleGameInterface:
         Returns:
             Colored string representation
         """
-        result = ""
-        for letter, fb in zip(word.upper(), feedback):
-            if fb == Feedback.CORRECT:
-                result += f"{Back.GREEN}{Fore.BLACK} {letter} {Style.RESET_ALL}"
-            elif fb == Feedback.PRESENT:
-                result += f"{Back.YELLOW}{Fore.BLACK} {letter} {Style.RESET_ALL}"
-            else:
-                result += f"{Back.WHITE}{Fore.BLACK} {letter} {Style.RESET_ALL}"
-        return result
+        return "".join(_FMT[fb].format(letter) for letter, fb in zip(word.upper(), feedback))
 
     def parse_feedback(self, feedback_str: str) -> Optional[List[Feedback]]:
         """
@@ -110,18 +169,10 @@ class WordleGameInterface:
         if len(feedback_str) != self.word_length:
             return None
 
-        feedback = []
-        for char in feedback_str.upper():
-            if char == 'G':
-                feedback.append(Feedback.CORRECT)
-            elif char == 'Y':
-                feedback.append(Feedback.PRESENT)
-            elif char == 'X':
-                feedback.append(Feedback.ABSENT)
-            else:
-                return None
-
-        return feedback
+        try:
+            return [_PARSE[char] for char in feedback_str.upper()]
+        except KeyError:
+            return None
 
     def get_solver_suggestion(self) -> Optional[str]:
         """
@@ -130,29 +181,43 @@ class WordleGameInterface:
         Returns:
             Suggested word or None
         """
-        return self.solver.get_best_guess(strategy="max_info")
+        suggestion = self.solver.get_best_guess(strategy="max_info")
+
+        if self._first_guess_pending:
+            stats = self.solver.get_stats()
+            if stats["possible_words"] == stats["total_words"]:
+                # Nothing eliminated yet: this is the opening suggestion
+                self.dict_manager.cache_first_guess("max_info", suggestion)
+                self._first_guess_pending = False
+
+        return suggestion
 
     def display_stats(self) -> None:
         """Display current solver statistics."""
         stats = self.solver.get_stats()
-        possible_words = self.solver.get_possible_words()
 
-        print(f"\n{Fore.CYAN}{'─' * 50}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}Solver Statistics:{Style.RESET_ALL}")
-        print(f"  Total words in dictionary: {Fore.YELLOW}{stats['total_words']}{Style.RESET_ALL}")
-        print(f"  Possible words remaining: {Fore.GREEN}{stats['possible_words']}{Style.RESET_ALL}")
-        print(f"  Elimination rate: {Fore.MAGENTA}{stats['elimination_rate']:.1%}{Style.RESET_ALL}")
-        print(f"  Attempts used: {Fore.BLUE}{len(self.attempts)}/{self.max_attempts}{Style.RESET_ALL}")
+        # Built as one block and written with a single print
+        lines = [
+            f"\n{Fore.CYAN}{'─' * 50}{Style.RESET_ALL}",
+            f"{Fore.CYAN}Solver Statistics:{Style.RESET_ALL}",
+            f"  Total words in dictionary: {Fore.YELLOW}{stats['total_words']}{Style.RESET_ALL}",
+            f"  Possible words remaining: {Fore.GREEN}{stats['possible_words']}{Style.RESET_ALL}",
+            f"  Elimination rate: {Fore.MAGENTA}{stats['elimination_rate']:.1%}{Style.RESET_ALL}",
+            f"  Attempts used: {Fore.BLUE}{len(self.attempts)}/{self.max_attempts}{Style.RESET_ALL}",
+        ]
 
         if stats['possible_words'] <= 20:
-            print(f"\n{Fore.CYAN}Possible words:{Style.RESET_ALL}")
-            for i, word in enumerate(possible_words, 1):
-                print(f"  {i}. {word}", end="  ")
+            # Only a short list is shown, so only then is it built and sorted
+            lines.append(f"\n{Fore.CYAN}Possible words:{Style.RESET_ALL}")
+            grid = ""
+            for i, word in enumerate(self.solver.get_possible_words(), 1):
+                grid += f"  {i}. {word}  "
                 if i % 5 == 0:
-                    print()
-            print()
+                    grid += "\n"
+            lines.append(grid)
 
-        print(f"{Fore.CYAN}{'─' * 50}{Style.RESET_ALL}\n")
+        lines.append(f"{Fore.CYAN}{'─' * 50}{Style.RESET_ALL}\n")
+        print("\n".join(lines))
 
     def play_assistant_mode(self) -> None:
         """Play in assistant mode where solver helps the user."""
@@ -213,8 +278,8 @@ class WordleGameInterface:
                 print(f"\n{Fore.GREEN}{Style.BRIGHT}🎉 CONGRATULATIONS! You solved it in {len(self.attempts) + 1} attempts!{Style.RESET_ALL}")
                 return
 
-            # Add feedback to solver
-            self.attempts.append((guess, feedback))
+            # Add feedback to solver; the history keeps it packed as a base-3 code
+            self.attempts.append((guess, encode_feedback(feedback)))
             self.solver.add_feedback(guess, feedback)
 
             # Show statistics
@@ -296,26 +361,27 @@ class WordleGameInterface:
             List of Feedback
         """
         feedback = [Feedback.ABSENT] * len(guess)
-        secret_chars = list(secret)
+        # Secret letters not yet matched by a green or yellow
+        remaining = Counter(secret)
 
         # First pass: mark correct positions
         for i, (g, s) in enumerate(zip(guess, secret)):
             if g == s:
                 feedback[i] = Feedback.CORRECT
-                secret_chars[i] = None
+                remaining[s] -= 1
 
         # Second pass: mark present letters
         for i, char in enumerate(guess):
-            if feedback[i] == Feedback.ABSENT and char in secret_chars:
+            if feedback[i] is Feedback.ABSENT and remaining[char] > 0:
                 feedback[i] = Feedback.PRESENT
-                secret_chars[secret_chars.index(char)] = None
+                remaining[char] -= 1
 
         return feedback
 
 
 def main():
     """Main entry point."""
-    print(f"\n{Fore.CYAN}{Style.BRIGHT}╔═══════════════════════════════════════════╗")
+    print(f"\n{Fore.CYAN}{Style.BRIGHT}╔═══════════════════════════════════════════╗{Style.RESET_ALL}")
     print(f"║   WORDLE CSP SOLVER - Main Menu       ║")
     print(f"╚═══════════════════════════════════════════╝{Style.RESET_ALL}\n")
 
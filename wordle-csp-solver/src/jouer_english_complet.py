@@ -15,7 +15,6 @@ Usage:
 import os
 from game_interface import WordleGameInterface
 from dictionary_manager import DictionaryManager
-from csp_solver import WordleCSPSolver
 
 
 def main() -> None:
@@ -39,9 +38,7 @@ def main() -> None:
     print()
 
     # Create game interface
-    game = WordleGameInterface(word_length=5, language="english", use_llm=False)
-    game.dict_manager = dict_mgr
-    game.solver = WordleCSPSolver(5, dict_mgr.get_words())
+    game = WordleGameInterface(word_length=5, language="english", use_llm=False, dict_manager=dict_mgr)
 
     # Display menu
     print("Choose mode:")
@@ -10,12 +10,15 @@ Dictionnaire: Charge une liste personnalisée de mots français de 5 lettres ou
 
 Utilisation:
     python jouer_francais_perso.py
+    python -m src.jouer_francais_perso
 """
 
-import os
-from game_interface import WordleGameInterface
-from dictionary_manager import DictionaryManager
-from csp_solver import WordleCSPSolver
+try:
+    from .game_interface import WordleGameInterface
+    from .dictionary_manager import DictionaryManager
+except ImportError:
+    from game_interface import WordleGameInterface
+    from dictionary_manager import DictionaryManager
 
 
 def main() -> None:
@@ -44,9 +47,7 @@ def main() -> None:
     print()
 
     # Créer l'interface de jeu avec le dictionnaire
-    game = WordleGameInterface(word_length=5, language="french", use_llm=False)
-    game.dict_manager = dict_mgr
-    game.solver = WordleCSPSolver(5, dict_mgr.get_words())
+    game = WordleGameInterface(word_length=5, language="french", use_llm=False, dict_manager=dict_mgr)
 
     # Afficher le menu
     print("🎮 Bienvenue au Wordle CSP Solver !")
@@ -5,11 +5,45 @@ Uses OpenAI's function calling to leverage LLM reasoning with CSP solving.
 
 import os
 import json
-from typing import List, Dict, Optional
-from openai import OpenAI
+import asyncio
+import time
+from typing import Callable, List, Dict, Optional, Tuple
+from openai import AsyncOpenAI, OpenAI
 from dotenv import load_dotenv
 
 
+# Sent first in every request, unchanged, together with the tool definitions:
+# the API caches identical request prefixes, so everything that varies
+# (summary, history, game state) goes after it
+_SYSTEM_PROMPT = """You are an expert Wordle solver assistant. You help users solve Wordle puzzles by:
+1. Analyzing feedback from guesses (green/yellow/gray)
+2. Using constraint satisfaction to filter possible words
+3. Suggesting optimal next guesses based on information theory
+4. Explaining your reasoning and strategy
+
+When the user provides feedback from a guess, use the apply_wordle_constraints function.
+To suggest the next guess, use suggest_best_guess function.
+Always explain your reasoning and strategy to help the user learn."""
+
+# Tool-calling rounds per turn before the LLM is asked to answer in text
+_MAX_TOOL_ROUNDS = 5
+
+# Conversation turns (user message and everything answering it) sent verbatim;
+# older turns are folded into a running summary, _SUMMARY_EVERY turns at a time
+_HISTORY_TURNS = 6
+_SUMMARY_EVERY = 3
+_SUMMARY_MODEL = "gpt-4o-mini"
+
+# List items kept in a tool result once its turn is over
+_TOOL_RESULT_SAMPLE = 5
+
+# Most words a get_possible_words call may return into the conversation
+_POSSIBLE_WORDS_LIMIT = 20
+
+# Batch API job states after which polling stops
+_BATCH_DONE = {"completed", "failed", "expired", "cancelled"}
+
+
 class WordleLLMAssistant:
     """
     LLM-powered assistant for Wordle solving using function calling.
@@ -29,10 +63,19 @@ class WordleLLMAssistant:
         if not self.api_key:
             print("Warning: No OpenAI API key found. LLM features will be disabled.")
             self.client = None
+            self.async_client = None
         else:
             self.client = OpenAI(api_key=self.api_key)
+            # One shared async client, so concurrent requests reuse its
+            # keep-alive connection pool
+            self.async_client = AsyncOpenAI(api_key=self.api_key)
+
+        # Built once so every request carries byte-identical tool definitions
+        self._tools = self.get_tool_definitions()
 
         self.conversation_history = []
+        # Summary of the turns dropped from conversation_history
+        self.history_summary = ""
 
     def get_function_definitions(self) -> List[Dict]:
         """
@@ -72,8 +115,12 @@ class WordleLLMAssistant:
                     "properties": {
                         "limit": {
                             "type": "integer",
-                            "description": "Maximum number of words to return (default: 20)",
-                            "default": 20
+                            "description": (
+                                f"Maximum number of words to return "
+                                f"(default: {_POSSIBLE_WORDS_LIMIT}, at most {_POSSIBLE_WORDS_LIMIT})"
+                            ),
+                            "default": _POSSIBLE_WORDS_LIMIT,
+                            "maximum": _POSSIBLE_WORDS_LIMIT
                         }
                     }
                 }
@@ -118,11 +165,24 @@ class WordleLLMAssistant:
             }
         ]
 
+    def get_tool_definitions(self) -> List[Dict]:
+        """
+        Function definitions in the chat completions "tools" format.
+
+        Returns:
+            List of tool definitions
+        """
+        return [
+            {"type": "function", "function": definition}
+            for definition in self.get_function_definitions()
+        ]
+
     def chat_with_context(
         self,
         user_message: str,
         available_functions: Dict,
-        model: str = "gpt-4-turbo-preview"
+        model: str = "gpt-4-turbo-preview",
+        on_token: Optional[Callable[[str], None]] = None
     ) -> str:
         """
         Chat with LLM using function calling for Wordle assistance.
@@ -131,6 +191,8 @@ class WordleLLMAssistant:
             user_message: User's message
             available_functions: Dictionary mapping function names to callable functions
             model: OpenAI model to use
+            on_token: If given, the reply is streamed and each text chunk is
+                passed to it as it arrives
 
         Returns:
             LLM's response
@@ -144,79 +206,421 @@ class WordleLLMAssistant:
             "content": user_message
         })
 
-        # Initial LLM call
-        response = self.client.chat.completions.create(
-            model=model,
-            messages=[
+        reply = self._chat_turn(self.conversation_history, available_functions, model, on_token)
+
+        old_turns = self._compact_history()
+        if old_turns:
+            response = self.client.chat.completions.create(**self._summary_request(old_turns))
+            self.history_summary = response.choices[0].message.content or self.history_summary
+
+        return reply
+
+    async def chat_with_context_async(
+        self,
+        user_message: str,
+        available_functions: Dict,
+        model: str = "gpt-4-turbo-preview",
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """
+        Same as chat_with_context, without blocking the event loop.
+
+        Args:
+            user_message: User's message
+            available_functions: Dictionary mapping function names to callable functions
+            model: OpenAI model to use
+            on_token: If given, the reply is streamed and each text chunk is
+                passed to it as it arrives
+
+        Returns:
+            LLM's response
+        """
+        if not self.async_client:
+            return "LLM integration is disabled. Please set OPENAI_API_KEY."
+
+        self.conversation_history.append({
+            "role": "user",
+            "content": user_message
+        })
+
+        reply = await self._chat_turn_async(self.conversation_history, available_functions, model, on_token)
+
+        old_turns = self._compact_history()
+        if old_turns:
+            response = await self.async_client.chat.completions.create(**self._summary_request(old_turns))
+            self.history_summary = response.choices[0].message.content or self.history_summary
+
+        return reply
+
+    async def analyze_aspects_async(
+        self,
+        aspects: List[str],
+        available_functions: Dict,
+        model: str = "gpt-4-turbo-preview"
+    ) -> Dict[str, str]:
+        """
+        Ask for several word-pattern analyses at once.
+
+        Each aspect is an independent one-shot exchange, kept out of the
+        conversation history, so all requests are in flight concurrently.
+
+        Args:
+            aspects: analyze_word_pattern aspects (e.g. "vowel_positions")
+            available_functions: Dictionary mapping function names to callable functions
+            model: OpenAI model to use
+
+        Returns:
+            Dictionary mapping each aspect to the LLM's analysis
+        """
+        if not self.async_client:
+            return {aspect: "LLM integration is disabled. Please set OPENAI_API_KEY." for aspect in aspects}
+
+        histories = [
+            [{
+                "role": "user",
+                "content": f"Use analyze_word_pattern to analyze the {aspect.replace('_', ' ')} "
+                           f"of the remaining words and summarize what it means for the next guess."
+            }]
+            for aspect in aspects
+        ]
+        replies = await asyncio.gather(*(
+            self._chat_turn_async(history, available_functions, model) for history in histories
+        ))
+        return dict(zip(aspects, replies))
+
+    def _chat_turn(
+        self,
+        history: List[Dict],
+        available_functions: Dict,
+        model: str,
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """
+        Answer the last user message of a history.
+
+        Tool calls are run in-process and all their results go back in a
+        single follow-up request, until the LLM answers in text.
+
+        Args:
+            history: Conversation so far, extended in place
+            available_functions: Dictionary mapping function names to callable functions
+            model: OpenAI model to use
+            on_token: Optional callback receiving streamed text chunks
+
+        Returns:
+            LLM's response
+        """
+        for round_number in range(_MAX_TOOL_ROUNDS + 1):
+            request = self._completion_request(history, model, round_number, on_token)
+            if on_token:
+                state = self._new_stream_state()
+                for chunk in self.client.chat.completions.create(**request):
+                    self._add_stream_chunk(state, chunk, on_token)
+                message = self._stream_message(state)
+            else:
+                response = self.client.chat.completions.create(**request)
+                message = self._response_message(response.choices[0].message)
+
+            history.append(message)
+            if not message.get("tool_calls"):
+                return message["content"]
+
+            for call in message["tool_calls"]:
+                history.append(self._run_tool_call(call, available_functions))
+
+        return message["content"]
+
+    async def _chat_turn_async(
+        self,
+        history: List[Dict],
+        available_functions: Dict,
+        model: str,
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """
+        Async counterpart of _chat_turn.
+
+        Args:
+            history: Conversation so far, extended in place
+            available_functions: Dictionary mapping function names to callable functions
+            model: OpenAI model to use
+            on_token: Optional callback receiving streamed text chunks
+
+        Returns:
+            LLM's response
+        """
+        for round_number in range(_MAX_TOOL_ROUNDS + 1):
+            request = self._completion_request(history, model, round_number, on_token)
+            if on_token:
+                state = self._new_stream_state()
+                async for chunk in await self.async_client.chat.completions.create(**request):
+                    self._add_stream_chunk(state, chunk, on_token)
+                message = self._stream_message(state)
+            else:
+                response = await self.async_client.chat.completions.create(**request)
+                message = self._response_message(response.choices[0].message)
+
+            history.append(message)
+            if not message.get("tool_calls"):
+                return message["content"]
+
+            # Tools act on the shared solver state, so they run in order
+            for call in message["tool_calls"]:
+                history.append(self._run_tool_call(call, available_functions))
+
+        return message["content"]
+
+    def _completion_request(
+        self,
+        history: List[Dict],
+        model: str,
+        round_number: int,
+        on_token: Optional[Callable[[str], None]]
+    ) -> Dict:
+        """
+        Arguments of one chat completions request.
+
+        Args:
+            history: Conversation so far
+            model: OpenAI model to use
+            round_number: Tool-calling rounds already done this turn
+            on_token: Optional streaming callback
+
+        Returns:
+            Keyword arguments for chat.completions.create
+        """
+        messages = [{"role": "system", "content": _SYSTEM_PROMPT}]
+        if history is self.conversation_history and self.history_summary:
+            messages.append({
+                "role": "system",
+                "content": f"Summary of the earlier conversation: {self.history_summary}"
+            })
+
+        return {
+            "model": model,
+            "messages": messages + history,
+            "tools": self._tools,
+            # Out of rounds: the LLM has to answer with what it has
+            "tool_choice": "auto" if round_number < _MAX_TOOL_ROUNDS else "none",
+            "stream": bool(on_token)
+        }
+
+    def _compact_history(self) -> List[Dict]:
+        """
+        Shrink conversation_history after a turn.
+
+        Tool results are cut down to a sample, since the full JSON (word
+        lists) would otherwise be re-sent with every later request. Once the
+        history holds _SUMMARY_EVERY turns more than _HISTORY_TURNS, the
+        oldest ones are removed so they can be folded into history_summary.
+
+        Returns:
+            Messages of the removed turns (empty if none were removed)
+        """
+        turn_starts = [
+            i for i, message in enumerate(self.conversation_history)
+            if message["role"] == "user"
+        ]
+
+        # Only the turn just answered still has full results
+        for message in self.conversation_history[turn_starts[-1] if turn_starts else 0:]:
+            if message["role"] == "tool":
+                message["content"] = self._compact_tool_result(message["content"])
+
+        if len(turn_starts) < _HISTORY_TURNS + _SUMMARY_EVERY:
+            return []
+
+        cut = turn_starts[-_HISTORY_TURNS]
+        old_turns = self.conversation_history[:cut]
+        del self.conversation_history[:cut]
+        return old_turns
+
+    @staticmethod
+    def _compact_tool_result(content: str) -> str:
+        """
+        Short form of a tool result: lists reduced to a few items and a count.
+
+        Args:
+            content: JSON tool result
+
+        Returns:
+            JSON with long lists shortened
+        """
+        try:
+            result = json.loads(content)
+        except ValueError:
+            return content
+
+        def shorten(value):
+            if isinstance(value, dict):
+                return {key: shorten(item) for key, item in value.items()}
+            if isinstance(value, list) and len(value) > _TOOL_RESULT_SAMPLE:
+                return value[:_TOOL_RESULT_SAMPLE] + [f"... ({len(value)} total)"]
+            return value
+
+        return json.dumps(shorten(result))
+
+    def _summary_request(self, old_turns: List[Dict]) -> Dict:
+        """
+        Arguments of the request folding old turns into history_summary.
+
+        Args:
+            old_turns: Messages removed from conversation_history
+
+        Returns:
+            Keyword arguments for chat.completions.create
+        """
+        lines = []
+        for message in old_turns:
+            if message.get("tool_calls"):
+                calls = ", ".join(
+                    f"{call['function']['name']}({call['function']['arguments']})"
+                    for call in message["tool_calls"]
+                )
+                lines.append(f"assistant called: {calls}")
+            if message.get("content"):
+                lines.append(f"{message['role']}: {message['content']}")
+
+        previous = self.history_summary or "(none)"
+        return {
+            "model": _SUMMARY_MODEL,
+            "messages": [
                 {
                     "role": "system",
-                    "content": """You are an expert Wordle solver assistant. You help users solve Wordle puzzles by:
-1. Analyzing feedback from guesses (green/yellow/gray)
-2. Using constraint satisfaction to filter possible words
-3. Suggesting optimal next guesses based on information theory
-4. Explaining your reasoning and strategy
+                    "content": "Summarize a Wordle solving conversation in a few sentences. "
+                               "Keep every guess, its feedback and the current candidates."
+                },
+                {
+                    "role": "user",
+                    "content": f"Summary so far: {previous}\n\nNew messages:\n" + "\n".join(lines)
+                }
+            ]
+        }
 
-When the user provides feedback from a guess, use the apply_wordle_constraints function.
-To suggest the next guess, use suggest_best_guess function.
-Always explain your reasoning and strategy to help the user learn."""
+    @staticmethod
+    def _response_message(message) -> Dict:
+        """
+        History entry for a non-streamed assistant message.
+
+        Args:
+            message: choices[0].message of a chat completion
+
+        Returns:
+            Assistant message dictionary
+        """
+        entry = {"role": "assistant", "content": message.content}
+        if message.tool_calls:
+            entry["tool_calls"] = [
+                {
+                    "id": call.id,
+                    "type": "function",
+                    "function": {"name": call.function.name, "arguments": call.function.arguments}
                 }
-            ] + self.conversation_history,
-            functions=self.get_function_definitions(),
-            function_call="auto"
-        )
+                for call in message.tool_calls
+            ]
+        return entry
 
-        assistant_message = response.choices[0].message
+    @staticmethod
+    def _new_stream_state() -> Dict:
+        """
+        Accumulator for the chunks of a streamed assistant message.
 
-        # Handle function calls
-        if assistant_message.function_call:
-            function_name = assistant_message.function_call.name
-            function_args = json.loads(assistant_message.function_call.arguments)
+        Returns:
+            Empty stream state
+        """
+        return {"content": [], "tool_calls": {}}
 
-            # Execute the function
-            if function_name in available_functions:
-                function_response = available_functions[function_name](**function_args)
+    @staticmethod
+    def _add_stream_chunk(state: Dict, chunk, on_token: Callable[[str], None]) -> None:
+        """
+        Merge one streamed chunk into the accumulated message.
 
-                # Add function call and response to history
-                self.conversation_history.append({
-                    "role": "assistant",
-                    "content": None,
-                    "function_call": {
-                        "name": function_name,
-                        "arguments": assistant_message.function_call.arguments
-                    }
-                })
-                self.conversation_history.append({
-                    "role": "function",
-                    "name": function_name,
-                    "content": json.dumps(function_response)
-                })
-
-                # Get final response from LLM
-                second_response = self.client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {"role": "system", "content": "You are an expert Wordle solver assistant."}
-                    ] + self.conversation_history
-                )
+        Args:
+            state: Stream state from _new_stream_state
+            chunk: Streamed chat completion chunk
+            on_token: Callback receiving the chunk's text, if any
+        """
+        if not chunk.choices:
+            return
+        delta = chunk.choices[0].delta
+
+        if delta.content:
+            state["content"].append(delta.content)
+            on_token(delta.content)
+
+        # Tool calls arrive in pieces, keyed by their index in the message
+        for call in delta.tool_calls or []:
+            entry = state["tool_calls"].setdefault(call.index, {
+                "id": None,
+                "type": "function",
+                "function": {"name": "", "arguments": ""}
+            })
+            if call.id:
+                entry["id"] = call.id
+            if call.function:
+                entry["function"]["name"] += call.function.name or ""
+                entry["function"]["arguments"] += call.function.arguments or ""
+
+    @staticmethod
+    def _stream_message(state: Dict) -> Dict:
+        """
+        History entry for a fully streamed assistant message.
 
-                final_message = second_response.choices[0].message.content
-                self.conversation_history.append({
-                    "role": "assistant",
-                    "content": final_message
-                })
+        Args:
+            state: Stream state the chunks were merged into
 
-                return final_message
-            else:
-                return f"Function {function_name} not available."
+        Returns:
+            Assistant message dictionary
+        """
+        entry = {"role": "assistant", "content": "".join(state["content"]) or None}
+        if state["tool_calls"]:
+            entry["tool_calls"] = [state["tool_calls"][index] for index in sorted(state["tool_calls"])]
+        return entry
 
-        # No function call, return direct response
-        response_content = assistant_message.content
-        self.conversation_history.append({
-            "role": "assistant",
-            "content": response_content
-        })
+    @staticmethod
+    def _run_tool_call(call: Dict, available_functions: Dict) -> Dict:
+        """
+        Execute one tool call the LLM asked for.
+
+        Every call needs an answer in the follow-up request, so unknown
+        functions are reported back to the LLM as an error result.
+        get_possible_words is held to _POSSIBLE_WORDS_LIMIT words whatever
+        limit the model asks for.
 
-        return response_content
+        Args:
+            call: Tool call from an assistant message
+            available_functions: Dictionary mapping function names to callable functions
+
+        Returns:
+            Tool message with the function's JSON result
+        """
+        function_name = call["function"]["name"]
+
+        if function_name in available_functions:
+            function_args = json.loads(call["function"]["arguments"] or "{}")
+            cap = _POSSIBLE_WORDS_LIMIT
+            if function_name == "get_possible_words" and "limit" in function_args:
+                # The schema's maximum is only advisory for the model
+                limit = function_args["limit"]
+                if isinstance(limit, int) and not isinstance(limit, bool):
+                    cap = max(0, min(limit, cap))
+                function_args["limit"] = cap
+            result = available_functions[function_name](**function_args)
+            if function_name == "get_possible_words":
+                # Also cut lists from functions that ignore the argument
+                if isinstance(result, list):
+                    result = result[:cap]
+                elif isinstance(result, dict):
+                    result = {key: value[:cap] if isinstance(value, list) else value
+                              for key, value in result.items()}
+        else:
+            result = {"error": f"Function {function_name} not available."}
+
+        return {
+            "role": "tool",
+            "tool_call_id": call["id"],
+            "content": json.dumps(result)
+        }
 
     def suggest_next_guess(
         self,
@@ -241,19 +645,139 @@ Always explain your reasoning and strategy to help the user learn."""
                 "reasoning": "LLM disabled, returning first possible word"
             }
 
-        prompt = f"""Based on the Wordle solving process:
-- Attempt number: {attempt_number}
-- Previous guesses: {', '.join(previous_guesses) if previous_guesses else 'None'}
-- Number of possible words remaining: {len(possible_words)}
-- Sample possible words: {', '.join(possible_words[:10])}
+        prompt = self._suggestion_prompt(possible_words, attempt_number, previous_guesses)
 
-Suggest the best next guess and explain your reasoning. Consider:
+        return self.chat_with_context(prompt, {})
+
+    def suggest_next_guess_batch(
+        self,
+        states: List[Tuple[List[str], int, List[str]]],
+        model: str = "gpt-4-turbo-preview",
+        poll_interval: float = 30.0
+    ) -> List[Optional[str]]:
+        """
+        Suggest next guesses for many game states through the Batch API.
+
+        Meant for offline evaluation runs (e.g. every answer of a word list):
+        batched requests cost half as much and have their own rate limits,
+        but complete asynchronously, within 24 hours.
+
+        Args:
+            states: (possible_words, attempt_number, previous_guesses) tuples,
+                as passed to suggest_next_guess
+            model: OpenAI model to use
+            poll_interval: Seconds between job status checks
+
+        Returns:
+            LLM's suggestion for each state, in order
+        """
+        prompts = [self._suggestion_prompt(*state) for state in states]
+        return self.batch_suggest(prompts, model, poll_interval)
+
+    def batch_suggest(
+        self,
+        prompts: List[str],
+        model: str = "gpt-4-turbo-preview",
+        poll_interval: float = 30.0
+    ) -> List[Optional[str]]:
+        """
+        Answer independent one-shot prompts with a single Batch API job.
+
+        Blocks until the job ends. Prompts are answered without function
+        calling and are kept out of the conversation history.
+
+        Args:
+            prompts: User messages, one request each
+            model: OpenAI model to use
+            poll_interval: Seconds between job status checks
+
+        Returns:
+            LLM's response for each prompt, in order (None for requests
+            that failed inside the batch)
+
+        Raises:
+            RuntimeError: If the batch job does not complete
+        """
+        if not self.client:
+            return ["LLM integration is disabled. Please set OPENAI_API_KEY."] * len(prompts)
+        if not prompts:
+            return []
+
+        # One JSONL line per request; custom_id maps results back to prompts
+        lines = [
+            json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": [
+                        {"role": "system", "content": _SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ]
+                }
+            })
+            for i, prompt in enumerate(prompts)
+        ]
+        batch_input = self.client.files.create(
+            file=("wordle_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_input.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+        while batch.status not in _BATCH_DONE:
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+        replies: List[Optional[str]] = [None] * len(prompts)
+        if batch.output_file_id:
+            output = self.client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                result = json.loads(line)
+                response = result.get("response") or {}
+                if response.get("status_code") == 200:
+                    replies[int(result["custom_id"])] = response["body"]["choices"][0]["message"]["content"]
+
+        return replies
+
+    @staticmethod
+    def _suggestion_prompt(
+        possible_words: List[str],
+        attempt_number: int,
+        previous_guesses: List[str]
+    ) -> str:
+        """
+        User message asking for the next guess.
+
+        Args:
+            possible_words: List of currently possible words
+            attempt_number: Current attempt number
+            previous_guesses: List of previous guesses
+
+        Returns:
+            Prompt text
+        """
+        # Fixed instructions first, game-specific data last (see _SYSTEM_PROMPT)
+        return f"""Suggest the best next guess for the Wordle solving process below and explain your reasoning. Consider:
 1. Information gain (eliminate maximum words)
 2. Common letter patterns
 3. Balancing exploration vs exploitation
-"""
 
-        return self.chat_with_context(prompt, {})
+Solving process:
+- Attempt number: {attempt_number}
+- Previous guesses: {', '.join(previous_guesses) if previous_guesses else 'None'}
+- Number of possible words remaining: {len(possible_words)}
+- Sample possible words: {', '.join(possible_words[:10])}
+"""
 
     def analyze_game_state(
         self,
@@ -273,17 +797,18 @@ Suggest the best next guess and explain your reasoning. Consider:
         if not self.client:
             return f"{len(possible_words)} words remaining"
 
-        prompt = f"""Analyze this Wordle game state:
+        # Fixed instructions first, game-specific data last (see _SYSTEM_PROMPT)
+        prompt = f"""Analyze the Wordle game state below and provide strategic insights about:
+1. How constrained the solution is
+2. Patterns in remaining words
+3. Best approach for next guess
+
+Game state:
 - Possible words remaining: {len(possible_words)}
 - Sample words: {', '.join(possible_words[:15])}
 - Known correct positions: {constraints.get('correct_positions', {})}
 - Present letters: {constraints.get('present_letters', set())}
 - Absent letters: {constraints.get('absent_letters', set())}
-
-Provide strategic insights about:
-1. How constrained the solution is
-2. Patterns in remaining words
-3. Best approach for next guess
 """
 
         return self.chat_with_context(prompt, {})
@@ -291,3 +816,4 @@ Provide strategic insights about:
     def reset_conversation(self) -> None:
         """Reset conversation history."""
         self.conversation_history = []
+        self.history_summary = ""
@@ -3,13 +3,133 @@ Advanced optimization strategies for Wordle solving.
 Implements information theory and heuristics to minimize attempts.
 """
 
+import hashlib
 import math
-from typing import List, Dict, Tuple, Set
+import os
+from functools import lru_cache
+from itertools import zip_longest
+from typing import List, Dict, Tuple, Set, Optional
 from collections import Counter
+
+import numpy as np
+
 try:
-    from .csp_solver import Feedback
+    from .csp_solver import Feedback, NUMBA_AVAILABLE, njit, prange
+    from .dictionary_manager import get_encoded_dictionary
 except ImportError:
-    from csp_solver import Feedback
+    from csp_solver import Feedback, NUMBA_AVAILABLE, njit, prange
+    from dictionary_manager import get_encoded_dictionary
+
+
+# Candidate lists at or below this size are grouped by pattern in plain Python
+_SMALL_PATTERN_POOL = 24
+
+# Largest dictionary whose full guess x answer pattern table is precomputed
+# (N^2 bytes, about 6 MB and under a second to build at the limit)
+_PATTERN_TABLE_MAX_WORDS = 2500
+
+# Guesses per block when filling the pattern table
+_PATTERN_TABLE_BLOCK = 64
+
+# Pattern tables of dictionaries at least this large are saved as .npy files,
+# keyed on the dictionary's content, and memory-mapped by later processes.
+# The directory can be moved with $WORDLE_CSP_CACHE_DIR (an empty value turns
+# the cache off) or per optimizer, see WordleOptimizer.__init__
+_PATTERN_CACHE_MIN_WORDS = 500
+_PATTERN_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "wordle-csp-solver")
+_PATTERN_CACHE_ENV = "WORDLE_CSP_CACHE_DIR"
+
+# Part of the cache key; bump whenever the pattern encoding or the way the
+# table is computed changes, so files written by older code are not loaded
+_PATTERN_CACHE_VERSION = 1
+
+# Pre-computed excellent starting words, in order of preference
+_GOOD_STARTERS = (
+    "arose", "slate", "crane", "soare", "trace",
+    "crate", "irate", "stare", "adieu", "audio"
+)
+
+# Guess pools larger than this are cut down to their best words by
+# letter-frequency score before entropy is computed exactly
+_ENTROPY_SHORTLIST = 200
+
+# Candidate sets remembered by the frequency and pattern-analysis memos
+_ANALYSIS_CACHE_SIZE = 32
+
+
+@njit
+def _guess_entropy(guess: np.ndarray, targets: np.ndarray) -> float:
+    """
+    Entropy of the pattern split one guess makes of the targets.
+
+    Computes each pattern with the rules of WordleOptimizer._get_pattern
+    and sums the groups in order of first occurrence, so the result is
+    bit-identical to calculate_entropy's.
+
+    Args:
+        guess: (word_length,) letter codes of the guess (255 = not in alphabet)
+        targets: (T, word_length) letter codes of the candidates
+
+    Returns:
+        Expected entropy in bits
+    """
+    n, length = targets.shape
+    sizes = np.zeros(3 ** length, dtype=np.int64)
+    order = np.empty(n, dtype=np.int64)
+    n_groups = 0
+    marks = np.zeros(length, dtype=np.uint8)
+    remaining = np.zeros(256, dtype=np.int64)
+
+    for t in range(n):
+        # Green pass; target letters left over can still turn guesses yellow
+        for i in range(length):
+            if guess[i] == targets[t, i]:
+                marks[i] = 2
+            else:
+                marks[i] = 0
+                remaining[targets[t, i]] += 1
+
+        # Yellow pass, left to right, one target copy per yellow
+        code = 0
+        for i in range(length):
+            if marks[i] == 0 and remaining[guess[i]] > 0:
+                marks[i] = 1
+                remaining[guess[i]] -= 1
+            code = code * 3 + marks[i]
+
+        for i in range(length):
+            remaining[targets[t, i]] = 0
+
+        if sizes[code] == 0:
+            order[n_groups] = code
+            n_groups += 1
+        sizes[code] += 1
+
+    # Same formula and summation order as WordleOptimizer._entropy_of
+    weighted = 0.0
+    for g in range(n_groups):
+        size = sizes[order[g]]
+        if size > 1:
+            weighted += size * math.log2(size)
+    return math.log2(n) - weighted / n
+
+
+@njit(parallel=True)
+def _guess_entropies(guesses: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    Entropy of every guess against the same targets, guesses split over threads.
+
+    Args:
+        guesses: (G, word_length) letter codes of the guesses
+        targets: (T, word_length) letter codes of the candidates
+
+    Returns:
+        (G,) entropies, each as computed by _guess_entropy
+    """
+    entropies = np.empty(guesses.shape[0], dtype=np.float64)
+    for g in prange(guesses.shape[0]):
+        entropies[g] = _guess_entropy(guesses[g], targets)
+    return entropies
 
 
 class WordleOptimizer:
@@ -18,16 +138,73 @@ class WordleOptimizer:
     Implements strategies to minimize the expected number of guesses.
     """
 
-    def __init__(self, dictionary: List[str]):
+    def __init__(
+        self,
+        dictionary: List[str],
+        encoded: Optional[Tuple[Dict[str, int], np.ndarray, np.ndarray]] = None,
+        pattern_cache_dir: Optional[str] = None
+    ):
         """
         Initialize optimizer.
 
         Args:
             dictionary: List of valid words
+            encoded: Precomputed encode_words() arrays for the dictionary's
+                distinct words (e.g. DictionaryManager.get_words_array()),
+                shared with the solver instead of re-encoded
+            pattern_cache_dir: Directory for saved pattern tables; None uses
+                $WORDLE_CSP_CACHE_DIR, else ~/.cache/wordle-csp-solver, and
+                an empty string disables the cache
         """
         self.dictionary = dictionary
         self.word_length = len(dictionary[0]) if dictionary else 5
 
+        # Structure-of-arrays view of the dictionary, row i <-> id_to_word[i]
+        self.id_to_word: List[str] = list(dict.fromkeys(dictionary))
+        self.word_to_id: Dict[str, int] = {word: i for i, word in enumerate(self.id_to_word)}
+        if encoded is None:
+            try:
+                encoded = get_encoded_dictionary(tuple(self.id_to_word), self.word_length)
+            except ValueError:
+                # Mixed word lengths: strategies fall back to string iteration
+                encoded = (None, None, None)
+        self._letter_index, self.word_codes, self.letter_masks = encoded
+        self._alphabet = sorted(self._letter_index, key=self._letter_index.get) if self._letter_index else []
+
+        # word_codes (N, word_length) and letter_masks (N,) are the
+        # structure-of-arrays view of the dictionary. Adding pos * alphabet_size
+        # to a column's codes gives every (position, letter) pair its own bin,
+        # so per-position letter counts are a single bincount
+        self._position_offsets = np.arange(self.word_length, dtype=np.intp) * len(self._alphabet)
+
+        # Guess x answer pattern codes, see _get_pattern_table()
+        self._pattern_table: Optional[np.ndarray] = None
+        if pattern_cache_dir is None:
+            pattern_cache_dir = os.environ.get(_PATTERN_CACHE_ENV, _PATTERN_CACHE_DIR)
+        self._pattern_cache_dir = pattern_cache_dir
+
+        # Per-candidate-set memos, keyed on the word tuple: the same list is
+        # analysed again across turns and by several callers
+        self._cached_frequencies = lru_cache(maxsize=_ANALYSIS_CACHE_SIZE)(self._letter_frequencies)
+        self._cached_patterns = lru_cache(maxsize=_ANALYSIS_CACHE_SIZE)(self._word_patterns)
+
+    def _word_rows(self, words: List[str]) -> Optional[np.ndarray]:
+        """
+        Map words to their rows in the packed dictionary arrays.
+
+        Args:
+            words: Words to look up
+
+        Returns:
+            Array of row ids, or None if some word is not in the dictionary
+        """
+        if self.word_codes is None:
+            return None
+        try:
+            return np.fromiter((self.word_to_id[word] for word in words), dtype=np.intp, count=len(words))
+        except KeyError:
+            return None
+
     def calculate_entropy(self, word: str, candidates: List[str]) -> float:
         """
         Calculate expected information (entropy) for a guess.
@@ -43,54 +220,254 @@ class WordleOptimizer:
         if not candidates:
             return 0.0
 
-        # Group candidates by the pattern they would produce
-        pattern_groups: Dict[Tuple, List[str]] = {}
+        rows = self._candidate_rows(candidates)
+        if NUMBA_AVAILABLE and rows is not None and len(word) == self.word_length:
+            return _guess_entropy(self._guess_codes(word), self.word_codes[rows])
+
+        sizes = self._pattern_group_sizes(word, candidates, rows)
+        return self._entropy_of(sizes, len(candidates))
+
+    @staticmethod
+    def _entropy_of(sizes: List[int], total: int) -> float:
+        """
+        Shannon entropy of a split of 'total' candidates into groups.
+
+        Args:
+            sizes: Group sizes
+            total: Number of candidates
+
+        Returns:
+            Entropy in bits
+        """
+        # -sum(p log2 p) with p = size / total, rewritten as
+        # log2(total) - sum(size log2 size) / total: one division in all,
+        # and singleton groups (size log2 size = 0) cost nothing
+        weighted = 0.0
+
+        for size in sizes:
+            if size > 1:
+                weighted += size * math.log2(size)
+
+        return math.log2(total) - weighted / total
+
+    def _candidate_rows(self, candidates: List[str]) -> Optional[np.ndarray]:
+        """
+        Dictionary rows of a candidate pool, looked up once per search.
+
+        Args:
+            candidates: Current possible solutions
+
+        Returns:
+            Array of row ids, or None if the pool is small enough for the
+            per-word path or holds words outside the dictionary
+        """
+        if len(candidates) <= _SMALL_PATTERN_POOL:
+            return None
+        return self._word_rows(candidates)
+
+    def _pattern_group_sizes(
+        self,
+        word: str,
+        candidates: List[str],
+        rows: Optional[np.ndarray]
+    ) -> List[int]:
+        """
+        Sizes of the groups candidates fall into by the pattern 'word' gives them.
+
+        Args:
+            word: Potential guess
+            candidates: Current possible solutions
+            rows: Candidate rows from _candidate_rows
+
+        Returns:
+            Group sizes, in order of each pattern's first occurrence
+        """
+        if rows is not None and len(word) == self.word_length:
+            table = self._get_pattern_table() if word in self.word_to_id else None
+            if table is not None:
+                patterns = table[self.word_to_id[word], rows]
+            else:
+                patterns = self._pattern_codes(word, rows)
+            _, first, counts = np.unique(patterns, return_index=True, return_counts=True)
+            return counts[np.argsort(first)].tolist()
+
+        # Group candidates by the pattern they would produce; the dict keeps
+        # first-occurrence order, which fixes the entropy summation order
+        pattern_groups: Dict[int, int] = {}
 
         for candidate in candidates:
             pattern = self._get_pattern(word, candidate)
-            if pattern not in pattern_groups:
-                pattern_groups[pattern] = []
-            pattern_groups[pattern].append(candidate)
+            pattern_groups[pattern] = pattern_groups.get(pattern, 0) + 1
 
-        # Calculate entropy using Shannon's formula
-        total = len(candidates)
-        entropy = 0.0
+        return list(pattern_groups.values())
+
+    def _pattern_codes(self, word: str, rows: np.ndarray) -> np.ndarray:
+        """
+        Patterns of one guess against many dictionary words at once.
+
+        Args:
+            word: The guessed word (of the dictionary's word length)
+            rows: Row ids of the target words
+
+        Returns:
+            (len(rows),) int64 pattern codes, as returned by _get_pattern
+        """
+        return self._pattern_block(self._guess_codes(word)[None, :], self.word_codes[rows])[0]
 
-        for group in pattern_groups.values():
-            probability = len(group) / total
-            if probability > 0:
-                entropy -= probability * math.log2(probability)
+    def _guess_codes(self, word: str) -> np.ndarray:
+        """
+        Letter codes of a guess in the dictionary's alphabet.
 
-        return entropy
+        Args:
+            word: The guessed word
+
+        Returns:
+            (len(word),) uint8 codes, 255 for letters outside the alphabet
+        """
+        # Letters outside the dictionary's alphabet never match (codes are < 64)
+        return np.array([self._letter_index.get(letter, 255) for letter in word], dtype=np.uint8)
 
-    def _get_pattern(self, guess: str, target: str) -> Tuple[int, ...]:
+    def _guess_matrix(self, words: List[str]) -> Optional[np.ndarray]:
+        """
+        Letter codes of a whole guess pool.
+
+        Args:
+            words: Guesses
+
+        Returns:
+            (len(words), word_length) uint8 codes, or None if some guess
+            has a different length
+        """
+        rows = self._word_rows(words)
+        if rows is not None:
+            return self.word_codes[rows]
+        if any(len(word) != self.word_length for word in words):
+            return None
+        return np.array([self._guess_codes(word) for word in words], dtype=np.uint8).reshape(-1, self.word_length)
+
+    @staticmethod
+    def _pattern_block(guesses: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        """
+        Patterns of several guesses against several targets, all at once.
+
+        Follows the same rules as _get_pattern, one position at a time over
+        every (guess, target) pair. Each pattern is packed as a base-3 int,
+        first letter most significant.
+
+        Args:
+            guesses: (G, word_length) letter codes of the guesses
+            targets: (T, word_length) letter codes of the targets
+
+        Returns:
+            (G, T) int64 pattern codes
+        """
+        green = guesses[:, None, :] == targets[None, :, :]
+        not_green = ~green
+        codes = np.zeros(green.shape[:2], dtype=np.int64)
+
+        for i in range(guesses.shape[1]):
+            letter = guesses[:, i, None]
+
+            # Copies of the letter in the target not used up by a green
+            available = ((targets[None, :, :] == letter[:, :, None]) & not_green).sum(axis=2)
+
+            # Earlier non-green copies of the letter in the guess take the
+            # available ones first, left to right
+            claimed = np.zeros_like(available)
+            for j in range(i):
+                claimed += (guesses[:, j, None] == letter) & not_green[:, :, j]
+
+            yellow = not_green[:, :, i] & (available > claimed)
+            codes *= 3
+            codes += np.where(green[:, :, i], 2, yellow)
+
+        return codes
+
+    def _get_pattern_table(self) -> Optional[np.ndarray]:
+        """
+        Pattern of every dictionary word against every other, built on first use.
+
+        table[g, t] is the pattern code of guessing word g when the answer is
+        word t (rows follow id_to_word).
+
+        Tables of large dictionaries are also saved in the pattern cache
+        directory (unless it is disabled), keyed on _PATTERN_CACHE_VERSION,
+        the word length and the word list, and memory-mapped on later runs.
+
+        Returns:
+            (N, N) pattern table, or None if the dictionary is not packed or
+            too large for an N x N table
+        """
+        if self._pattern_table is None:
+            n = len(self.id_to_word)
+            if self.word_codes is None or n > _PATTERN_TABLE_MAX_WORDS or 3 ** self.word_length > 2 ** 16:
+                return None
+
+            dtype = np.uint8 if 3 ** self.word_length <= 2 ** 8 else np.uint16
+            cache_path = None
+            if self._pattern_cache_dir and n >= _PATTERN_CACHE_MIN_WORDS:
+                key = f"v{_PATTERN_CACHE_VERSION}\nL{self.word_length}\n" + "\n".join(self.id_to_word)
+                digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+                cache_path = os.path.join(self._pattern_cache_dir, f"patterns_{digest}.npy")
+                try:
+                    table = np.load(cache_path, mmap_mode='r')
+                    if table.shape == (n, n) and table.dtype == dtype:
+                        self._pattern_table = table
+                        return table
+                except (OSError, ValueError):
+                    # Missing or unreadable cache: build the table
+                    pass
+
+            table = np.empty((n, n), dtype=dtype)
+            # Guesses go in blocks to bound the (block, N, word_length) intermediates
+            for start in range(0, n, _PATTERN_TABLE_BLOCK):
+                block = self.word_codes[start:start + _PATTERN_TABLE_BLOCK]
+                table[start:start + len(block)] = self._pattern_block(block, self.word_codes)
+            self._pattern_table = table
+
+            if cache_path is not None:
+                try:
+                    # Written aside and renamed, so no process maps a partial file
+                    os.makedirs(self._pattern_cache_dir, exist_ok=True)
+                    partial_path = f"{cache_path}.{os.getpid()}.tmp"
+                    with open(partial_path, 'wb') as f:
+                        np.save(f, table)
+                    os.replace(partial_path, cache_path)
+                except OSError:
+                    # Read-only location: the cache is only an optimization
+                    pass
+        return self._pattern_table
+
+    def _get_pattern(self, guess: str, target: str) -> int:
         """
         Get the pattern that would result from guessing 'guess' when answer is 'target'.
-        Returns tuple of: 0=absent, 1=present, 2=correct
+        Packed as a base-3 int of digits 0=absent, 1=present, 2=correct,
+        first letter most significant (0..242 for 5 letters).
 
         Args:
             guess: The guessed word
             target: The target word
 
         Returns:
-            Pattern tuple
+            Pattern code
         """
-        pattern = [0] * len(guess)
-        target_chars = list(target)
-
-        # First pass: mark correct positions
-        for i, (g, t) in enumerate(zip(guess, target)):
-            if g == t:
-                pattern[i] = 2
-                target_chars[i] = None
-
-        # Second pass: mark present letters
+        # First pass: count the target letters not taken by a correct position
+        remaining: Dict[str, int] = {}
+        for i, t in enumerate(target):
+            if i >= len(guess) or guess[i] != t:
+                remaining[t] = remaining.get(t, 0) + 1
+
+        # Second pass: correct positions, then present letters left to right,
+        # each using up one remaining copy
+        code = 0
         for i, char in enumerate(guess):
-            if pattern[i] == 0 and char in target_chars:
-                pattern[i] = 1
-                target_chars[target_chars.index(char)] = None
-
-        return tuple(pattern)
+            code *= 3
+            if i < len(target) and target[i] == char:
+                code += 2
+            elif remaining.get(char):
+                remaining[char] -= 1
+                code += 1
+        return code
 
     def get_best_guess_by_entropy(
         self,
@@ -115,19 +492,57 @@ class WordleOptimizer:
 
         # Use all words for first guess, candidates for later
         guess_pool = all_words if all_words and len(candidates) > 2 else candidates
+        if len(guess_pool) > _ENTROPY_SHORTLIST:
+            guess_pool = self._frequency_shortlist(guess_pool, candidates, _ENTROPY_SHORTLIST)
+
+        rows = self._candidate_rows(candidates)
+        guesses = self._guess_matrix(guess_pool) if NUMBA_AVAILABLE and rows is not None else None
+        if guesses is not None:
+            # Every guess scored in one parallel call; argmax keeps the first
+            # best guess, like the loop below
+            entropies = _guess_entropies(guesses, self.word_codes[rows])
+            return guess_pool[int(np.argmax(entropies))]
 
         best_word = None
         best_entropy = -1
+        total = len(candidates)
 
         for word in guess_pool:
-            entropy = self.calculate_entropy(word, candidates)
+            sizes = self._pattern_group_sizes(word, candidates, rows)
+            entropy = self._entropy_of(sizes, total)
 
             if entropy > best_entropy:
                 best_entropy = entropy
                 best_word = word
 
+                # Every candidate alone in its group: the upper bound
+                # log2(total) is reached, later guesses can only tie
+                if len(sizes) == total:
+                    break
+
         return best_word
 
+    def _frequency_shortlist(self, words: List[str], candidates: List[str], size: int) -> List[str]:
+        """
+        Best-scoring words by letter frequency over the candidates.
+
+        Args:
+            words: Guess pool
+            candidates: Current possible solutions
+            size: Number of words to keep
+
+        Returns:
+            The 'size' highest-scoring words, in their original order
+        """
+        rows, candidate_rows = self._word_rows(words), self._word_rows(candidates)
+        if rows is not None and candidate_rows is not None:
+            scores = self._frequency_scores(rows, candidate_rows)
+        else:
+            frequencies = self.get_letter_frequencies(candidates)
+            scores = np.array([self.score_word_by_frequency(word, frequencies) for word in words])
+        keep = np.sort(np.argsort(-scores, kind="stable")[:size])
+        return [words[i] for i in keep.tolist()]
+
     def get_letter_frequencies(self, words: List[str]) -> Dict[Tuple[int, str], float]:
         """
         Calculate letter frequency at each position.
@@ -138,9 +553,36 @@ class WordleOptimizer:
         Returns:
             Dictionary mapping (position, letter) to frequency
         """
-        frequencies: Dict[Tuple[int, str], int] = {}
+        return dict(self._cached_frequencies(tuple(words)))
+
+    def _letter_frequencies(self, words: Tuple[str, ...]) -> Dict[Tuple[int, str], float]:
+        """
+        Uncached body of get_letter_frequencies.
+
+        Args:
+            words: Words to analyze
+
+        Returns:
+            Dictionary mapping (position, letter) to frequency
+        """
         total = len(words)
 
+        rows = self._word_rows(words)
+        if rows is not None:
+            n_letters = len(self._alphabet)
+            counts = np.bincount(
+                (self.word_codes[rows] + self._position_offsets).ravel(),
+                minlength=self.word_length * n_letters
+            ).reshape(self.word_length, n_letters)
+            positions, letters = np.nonzero(counts)
+            counts = counts.tolist()
+            return {
+                (pos, self._alphabet[code]): counts[pos][code] / total
+                for pos, code in zip(positions.tolist(), letters.tolist())
+            }
+
+        frequencies: Dict[Tuple[int, str], int] = {}
+
         for word in words:
             for pos, letter in enumerate(word):
                 key = (pos, letter)
@@ -178,6 +620,36 @@ class WordleOptimizer:
 
         return score
 
+    def _frequency_scores(self, rows: np.ndarray, candidate_rows: np.ndarray) -> np.ndarray:
+        """
+        score_word_by_frequency for many dictionary words at once.
+
+        Adds the same terms in the same order as the scalar version (adding
+        0.0 for repeated letters is exact), so scores and ties match it bit
+        for bit.
+
+        Args:
+            rows: Rows of the words to score
+            candidate_rows: Rows of the words the frequencies are taken over
+
+        Returns:
+            (len(rows),) float64 scores
+        """
+        n_letters = len(self._alphabet)
+        counts = np.bincount(
+            (self.word_codes[candidate_rows] + self._position_offsets).ravel(),
+            minlength=self.word_length * n_letters
+        ).reshape(self.word_length, n_letters)
+        frequencies = counts / len(candidate_rows)
+
+        codes = self.word_codes[rows]
+        scores = np.zeros(len(rows))
+        for pos in range(self.word_length):
+            scores += frequencies[pos, codes[:, pos]]
+            # Bonus for unique letters: first occurrence of the letter in the word
+            scores += 0.1 * ~(codes[:, :pos] == codes[:, pos, None]).any(axis=1)
+        return scores
+
     def get_strategic_first_guess(self, all_words: List[str]) -> str:
         """
         Get optimal first guess using pre-computed strategy.
@@ -189,15 +661,18 @@ class WordleOptimizer:
         Returns:
             Recommended first guess
         """
-        # Pre-computed excellent starting words
-        good_starters = [
-            "arose", "slate", "crane", "soare", "trace",
-            "crate", "irate", "stare", "adieu", "audio"
-        ]
+        # Hash lookups instead of a list scan per starter; the optimizer's
+        # own dictionary is already indexed
+        if all_words is self.dictionary:
+            available = self.word_to_id
+        elif isinstance(all_words, (set, frozenset, dict)):
+            available = all_words
+        else:
+            available = set(all_words)
 
         # Use first available from pre-computed list
-        for word in good_starters:
-            if word in all_words:
+        for word in _GOOD_STARTERS:
+            if word in available:
                 return word
 
         # Fallback: calculate best by entropy
@@ -216,26 +691,52 @@ class WordleOptimizer:
         if not words:
             return {}
 
-        # Letter position analysis
-        position_letters: Dict[int, Counter] = {
-            i: Counter() for i in range(self.word_length)
-        }
+        return dict(self._cached_patterns(tuple(words)))
 
-        for word in words:
-            for pos, letter in enumerate(word):
-                position_letters[pos][letter] += 1
+    def _word_patterns(self, words: Tuple[str, ...]) -> Dict:
+        """
+        Uncached body of analyze_word_patterns.
 
-        # Overall letter frequency
-        all_letters = Counter(''.join(words))
+        Args:
+            words: Non-empty words to analyze
 
-        # Vowel analysis
+        Returns:
+            Dictionary with pattern analysis
+        """
         vowels = set('aeiou')
-        vowel_positions = {i: 0 for i in range(self.word_length)}
 
-        for word in words:
-            for pos, letter in enumerate(word):
-                if letter in vowels:
-                    vowel_positions[pos] += 1
+        rows = self._word_rows(words)
+        if rows is not None:
+            # Straight off the code matrix: no per-letter Counter updates and
+            # no joined copy of the word list
+            codes = self.word_codes[rows]
+            position_letters = {
+                pos: self._most_common_codes(codes[:, pos], 5)
+                for pos in range(self.word_length)
+            }
+            common_letters = self._most_common_codes(codes.ravel(), 10)
+            vowel_codes = [self._letter_index[vowel] for vowel in vowels if vowel in self._letter_index]
+            vowel_counts = np.isin(codes, vowel_codes).sum(axis=0).tolist()
+            vowel_positions = {pos: vowel_counts[pos] for pos in range(self.word_length)}
+        else:
+            # Letter position analysis, one column of letters per position
+            columns = list(zip_longest(*words))
+            position_counts: Dict[int, Counter] = {}
+            for pos in range(self.word_length):
+                letters = Counter(columns[pos]) if pos < len(columns) else Counter()
+                letters.pop(None, None)  # Padding for words shorter than pos
+                position_counts[pos] = letters
+
+            position_letters = {pos: letters.most_common(5) for pos, letters in position_counts.items()}
+
+            # Overall letter frequency
+            common_letters = Counter(''.join(words)).most_common(10)
+
+            # Vowel analysis, read off the position counts
+            vowel_positions = {
+                pos: sum(letters[vowel] for vowel in vowels)
+                for pos, letters in position_counts.items()
+            }
 
         # Common prefixes and suffixes
         prefixes = Counter(word[:2] for word in words)
@@ -243,16 +744,31 @@ class WordleOptimizer:
 
         return {
             "total_words": len(words),
-            "position_letters": {
-                pos: letters.most_common(5)
-                for pos, letters in position_letters.items()
-            },
-            "common_letters": all_letters.most_common(10),
+            "position_letters": position_letters,
+            "common_letters": common_letters,
             "vowel_positions": vowel_positions,
             "common_prefixes": prefixes.most_common(5),
             "common_suffixes": suffixes.most_common(5)
         }
 
+    def _most_common_codes(self, codes: np.ndarray, k: int) -> List[Tuple[str, int]]:
+        """
+        Counter.most_common over letter codes, ties in first-seen order.
+
+        Args:
+            codes: Letter codes, in word order
+            k: Number of letters to return
+
+        Returns:
+            Up to k (letter, count) pairs, most frequent first
+        """
+        letters, first, counts = np.unique(codes, return_index=True, return_counts=True)
+        order = np.lexsort((first, -counts))[:k]
+        return [
+            (self._alphabet[code], count)
+            for code, count in zip(letters[order].tolist(), counts[order].tolist())
+        ]
+
     def get_minimax_guess(
         self,
         candidates: List[str],
@@ -278,17 +794,11 @@ class WordleOptimizer:
 
         best_word = None
         best_max_remaining = float('inf')
+        rows = self._candidate_rows(candidates)
 
         for word in guess_pool[:min(len(guess_pool), 50)]:  # Limit for performance
-            # Group candidates by pattern
-            pattern_groups: Dict[Tuple, int] = {}
-
-            for candidate in candidates:
-                pattern = self._get_pattern(word, candidate)
-                pattern_groups[pattern] = pattern_groups.get(pattern, 0) + 1
-
-            # Find max group size
-            max_remaining = max(pattern_groups.values()) if pattern_groups else 0
+            # Find max group size among candidates grouped by pattern
+            max_remaining = max(self._pattern_group_sizes(word, candidates, rows))
 
             if max_remaining < best_max_remaining:
                 best_max_remaining = max_remaining
@@ -315,6 +825,11 @@ class WordleOptimizer:
         if not candidates:
             return None
 
+        rows = self._word_rows(candidates)
+        if rows is not None:
+            # argmax keeps the first best word, like the loop below
+            return candidates[int(np.argmax(self._frequency_scores(rows, rows)))]
+
         frequencies = self.get_letter_frequencies(candidates)
 
         best_word = None
@@ -19,7 +19,10 @@ Test Coverage:
 Run with: python -m pytest test_csp_solver.py
 """
 
-from csp_solver import WordleCSPSolver, Feedback
+import pytest
+
+from csp_solver import WordleCSPSolver, Feedback, encode_feedback, decode_feedback
+from dictionary_manager import encode_words
 
 
 def test_basic_constraints():
@@ -185,6 +188,121 @@ def test_reset():
     print("✓ Reset test passed")
 
 
+def test_incremental_filtering():
+    """Test that filtering on each new feedback matches a full re-filter."""
+    dictionary = ["slate", "scale", "scare", "stare", "share", "shale", "spare"]
+    solver = WordleCSPSolver(5, dictionary)
+
+    solver.add_feedback("slate", [
+        Feedback.CORRECT, Feedback.ABSENT, Feedback.CORRECT, Feedback.ABSENT, Feedback.CORRECT
+    ])
+    solver.add_feedback("scare", [
+        Feedback.CORRECT, Feedback.ABSENT, Feedback.CORRECT, Feedback.CORRECT, Feedback.CORRECT
+    ])
+    incremental = solver.get_possible_words()
+
+    # Re-applying every accumulated constraint must not change the result
+    solver._apply_constraints()
+    assert solver.get_possible_words() == incremental
+    assert incremental == ["share", "spare"]
+
+    print("✓ Incremental filtering test passed")
+
+
+def test_shared_encoding():
+    """Test that solvers over the same words share one encoding."""
+    dictionary = ["slate", "crane", "trace", "crate"]
+    first = WordleCSPSolver(5, dictionary)
+    second = WordleCSPSolver(5, list(dictionary))
+
+    assert first._word_codes is second._word_codes
+    assert first._letter_masks is second._letter_masks
+
+    # Filtering one solver must leave the other untouched
+    first.add_feedback("crane", [Feedback.CORRECT] * 5)
+    assert first.get_possible_words() == ["crane"]
+    assert second.get_possible_words() == sorted(dictionary)
+
+    print("✓ Shared encoding test passed")
+
+
+def test_feedback_encoding():
+    """Test base-3 packing of feedback lists."""
+    feedback = [Feedback.CORRECT, Feedback.ABSENT, Feedback.PRESENT, Feedback.ABSENT, Feedback.CORRECT]
+
+    assert encode_feedback([Feedback.ABSENT] * 5) == 0
+    assert encode_feedback([Feedback.CORRECT] * 5) == 242
+    assert encode_feedback(feedback) == 2 * 81 + 1 * 9 + 2
+    assert decode_feedback(encode_feedback(feedback), 5) == feedback
+
+    print("✓ Feedback encoding test passed")
+
+
+def test_initial_best_guess():
+    """Test that the opening suggestion is reused after reset and can be seeded."""
+    dictionary = ["slate", "crane", "trace", "crate", "share"]
+    solver = WordleCSPSolver(5, dictionary)
+
+    first = solver.get_best_guess()
+    assert first == solver.initial_best_guess
+
+    solver.add_feedback("share", [Feedback.ABSENT] * 5)
+    solver.reset()
+    assert solver.get_best_guess() == first
+
+    # A value persisted by an earlier run is used as is
+    seeded = WordleCSPSolver(5, dictionary)
+    seeded.initial_best_guess = "trace"
+    assert seeded.get_best_guess() == "trace"
+
+    print("✓ Initial best guess test passed")
+
+
+def test_mixed_length_dictionary():
+    """Test that words of another length are left out instead of rejected."""
+    solver = WordleCSPSolver(5, ["apple", "banana", "angle"])
+
+    assert solver.get_possible_words() == ["angle", "apple"]
+
+    solver.add_feedback("apple", [
+        Feedback.CORRECT, Feedback.ABSENT, Feedback.ABSENT, Feedback.CORRECT, Feedback.CORRECT
+    ])
+    assert solver.get_possible_words() == ["angle"]
+
+    print("✓ Mixed length dictionary test passed")
+
+
+def test_large_alphabet():
+    """Test that dictionaries with more than 64 distinct letters still filter."""
+    letters = [chr(0x100 + i) for i in range(70)]
+    dictionary = [a + b for a, b in zip(letters, reversed(letters))]
+    solver = WordleCSPSolver(2, dictionary)
+
+    assert len(solver.get_possible_words()) == 70
+    assert solver.get_best_guess() in dictionary
+
+    # First letter known, second letter absent
+    solver.add_feedback(letters[3] + letters[0], [Feedback.CORRECT, Feedback.ABSENT])
+    assert solver.get_possible_words() == [dictionary[3]]
+
+    print("✓ Large alphabet test passed")
+
+
+def test_encode_words_limits():
+    """Test that encode_words rejects what the packed layout cannot hold."""
+    with pytest.raises(ValueError, match="length 5"):
+        encode_words(["apple", "banana"], 5)
+
+    with pytest.raises(ValueError, match="max 64"):
+        encode_words([chr(0x100 + i) for i in range(70)], 1)
+
+    letter_index, codes, masks = encode_words(["ab", "ba"], 2)
+    assert codes.shape == (2, 2) and len(letter_index) == 2
+    assert masks.tolist() == [3, 3]
+
+    print("✓ encode_words limits test passed")
+
+
 def run_all_tests():
     """Run all tests."""
     print("\n" + "=" * 50)
@@ -198,6 +316,13 @@ def run_all_tests():
     test_best_guess()
     test_stats()
     test_reset()
+    test_incremental_filtering()
+    test_shared_encoding()
+    test_feedback_encoding()
+    test_initial_best_guess()
+    test_mixed_length_dictionary()
+    test_large_alphabet()
+    test_encode_words_limits()
 
     print("\n" + "=" * 50)
     print("✓ All tests passed!")
@@ -0,0 +1,156 @@
+"""
+Unit Tests for Dictionary Manager Caches
+
+Tests the files DictionaryManager writes next to a dictionary:
+  - Parsed word list cache (<file>.L{n}.v{version}.pkl)
+  - Opening guess cache (<file>.L{n}.v{version}.first.pkl)
+
+Test Coverage:
+  - Cache written on first load and reused on the next one
+  - Cache ignored once the dictionary file is modified
+  - No first-guess cache for word lists without a single source file
+  - Cached guesses outside the word list are rejected
+  - Game interface storing and reusing the opening suggestion
+
+Run with: python -m pytest test_dictionary_manager.py
+"""
+
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+from dictionary_manager import DictionaryManager, _CACHE_VERSION
+from game_interface import WordleGameInterface
+
+
+WORDS = ["crane", "slate", "trace", "crate", "react", "caret"]
+
+
+def _write_dictionary(directory: Path) -> str:
+    """Write WORDS to a dictionary file in directory and return its path."""
+    path = directory / "words.txt"
+    path.write_text("\n".join(WORDS + ["toolong", "abc"]) + "\n")
+    return str(path)
+
+
+def _touch_later(path: str) -> None:
+    """Move the modification time of path one minute forward."""
+    stamp = os.path.getmtime(path) + 60
+    os.utime(path, (stamp, stamp))
+
+
+def test_parse_cache(tmp_path):
+    """
+    Test the parsed word list cache.
+
+    Verifies that loading a file writes the cache, that a later load reads
+    it instead of the text file, and that editing the file invalidates it.
+    """
+    path = _write_dictionary(tmp_path)
+    cache_path = f"{path}.L5.v{_CACHE_VERSION}.pkl"
+
+    manager = DictionaryManager(5)
+    manager.load_from_file(path)
+    assert manager.words == set(WORDS)
+    assert os.path.exists(cache_path)
+
+    # Reused: a marker stored in the cache shows up in the next load
+    with open(cache_path, 'wb') as f:
+        pickle.dump({"cache"}, f)
+    manager = DictionaryManager(5)
+    manager.load_from_file(path)
+    assert manager.words == {"cache"}
+
+    # Stale: the text file is parsed again and the cache rewritten
+    _touch_later(path)
+    manager = DictionaryManager(5)
+    manager.load_from_file(path)
+    assert manager.words == set(WORDS)
+    with open(cache_path, 'rb') as f:
+        assert pickle.load(f) == set(WORDS)
+
+    print("✓ Parse cache test passed")
+
+
+def test_first_guess_cache(tmp_path):
+    """
+    Test the opening guess cache.
+
+    Verifies that a stored guess is reused for the same file, dropped once
+    the file changes or when it is not in the word list, and never stored
+    for word lists built from several sources.
+    """
+    path = _write_dictionary(tmp_path)
+    manager = DictionaryManager(5)
+    manager.load_from_file(path)
+    assert manager.get_cached_first_guess("max_info") is None
+
+    # Written and reused by another manager on the same file
+    manager.cache_first_guess("max_info", "slate")
+    assert os.path.exists(f"{path}.L5.v{_CACHE_VERSION}.first.pkl")
+    other = DictionaryManager(5)
+    other.load_from_file(path)
+    assert other.get_cached_first_guess("max_info") == "slate"
+    assert other.get_cached_first_guess("first") is None
+
+    # A word outside the dictionary is never returned
+    other.cache_first_guess("max_info", "zzzzz")
+    assert other.get_cached_first_guess("max_info") is None
+
+    # Stale once the dictionary file is modified
+    other.cache_first_guess("max_info", "slate")
+    _touch_later(path)
+    assert other.get_cached_first_guess("max_info") is None
+
+    # No source file: nothing is read or written
+    added = DictionaryManager(5)
+    added.add_words(WORDS)
+    assert added.source_path is None
+    added.cache_first_guess("max_info", "slate")
+    assert added.get_cached_first_guess("max_info") is None
+
+    print("✓ First guess cache test passed")
+
+
+def test_interface_first_guess(tmp_path):
+    """
+    Test that the game interface stores its opening suggestion.
+
+    Verifies that the first interface computes and stores the opening
+    guess, and that the next one starts from the stored value.
+    """
+    path = _write_dictionary(tmp_path)
+
+    game = WordleGameInterface(dict_path=path)
+    assert game._first_guess_pending
+    suggestion = game.get_solver_suggestion()
+    assert suggestion in WORDS
+    assert not game._first_guess_pending
+    assert game.dict_manager.get_cached_first_guess("max_info") == suggestion
+
+    game = WordleGameInterface(dict_path=path)
+    assert not game._first_guess_pending
+    assert game.solver.initial_best_guess == suggestion
+    assert game.get_solver_suggestion() == suggestion
+
+    print(f"✓ Interface first guess test passed (opening: {suggestion})")
+
+
+def run_all_tests():
+    """Run all dictionary manager tests."""
+    print("\n" + "=" * 50)
+    print("Running Dictionary Manager Tests")
+    print("=" * 50 + "\n")
+
+    for test in (test_parse_cache, test_first_guess_cache, test_interface_first_guess):
+        with tempfile.TemporaryDirectory() as directory:
+            test(Path(directory))
+
+    print("\n" + "=" * 50)
+    print("✓ All dictionary manager tests passed!")
+    print("=" * 50 + "\n")
+
+
+if __name__ == "__main__":
+    run_all_tests()
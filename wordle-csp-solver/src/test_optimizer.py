@@ -22,7 +22,14 @@ Test Coverage:
 Run with: python -m pytest test_optimizer.py
 """
 
-from optimizer import WordleOptimizer
+import itertools
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from optimizer import WordleOptimizer, _PATTERN_CACHE_ENV, _PATTERN_CACHE_MIN_WORDS
 
 
 def test_entropy_calculation():
@@ -50,6 +57,17 @@ def test_best_guess_by_entropy():
     print(f"✓ Best guess by entropy test passed (suggested: {best})")
 
 
+def test_entropy_shortlist():
+    """Test the frequency shortlist applied to large guess pools."""
+    dictionary = ["crane", "slate", "zzzzz", "trace", "qajaq", "crate"]
+    optimizer = WordleOptimizer(dictionary)
+
+    shortlist = optimizer._frequency_shortlist(dictionary, ["crane", "trace", "crate"], 3)
+    assert shortlist == ["crane", "trace", "crate"]  # Original order kept
+
+    print(f"✓ Entropy shortlist test passed (kept: {shortlist})")
+
+
 def test_letter_frequencies():
     """Test letter frequency calculation."""
     dictionary = ["hello", "world", "helps"]
@@ -102,6 +120,61 @@ def test_pattern_analysis():
     print(f"  Common letters: {analysis['common_letters'][:3]}")
 
 
+def test_analysis_cache():
+    """Test that cached analyses are reused but not shared with callers."""
+    dictionary = ["start", "stare", "state", "store", "stone"]
+    optimizer = WordleOptimizer(dictionary)
+
+    frequencies = optimizer.get_letter_frequencies(dictionary)
+    frequencies[(0, 's')] = 0.0
+    assert optimizer.get_letter_frequencies(dictionary)[(0, 's')] == 1.0
+
+    analysis = optimizer.analyze_word_patterns(dictionary)
+    assert analysis == optimizer.analyze_word_patterns(list(dictionary))
+    assert analysis["vowel_positions"] == {0: 0, 1: 0, 2: 5, 3: 0, 4: 4}
+    assert optimizer._cached_patterns.cache_info().hits == 1
+
+    print("✓ Analysis cache test passed")
+
+
+def test_pattern_cache_dir(tmp_path):
+    """
+    Test where pattern tables of large dictionaries are saved.
+
+    Verifies that the table is written to and reloaded from the directory
+    given to the optimizer or in the environment, and that an empty
+    directory turns the cache off.
+    """
+    words = itertools.product("abcdefgh", repeat=5)
+    dictionary = ["".join(letters) for letters in itertools.islice(words, _PATTERN_CACHE_MIN_WORDS)]
+
+    # Constructor argument: written, then memory-mapped by the next optimizer
+    table = WordleOptimizer(dictionary, pattern_cache_dir=str(tmp_path / "arg"))._get_pattern_table()
+    assert len(os.listdir(tmp_path / "arg")) == 1
+    cached = WordleOptimizer(dictionary, pattern_cache_dir=str(tmp_path / "arg"))._get_pattern_table()
+    assert isinstance(cached, np.memmap)
+    assert np.array_equal(cached, table)
+
+    previous = os.environ.get(_PATTERN_CACHE_ENV)
+    try:
+        os.environ[_PATTERN_CACHE_ENV] = str(tmp_path / "env")
+        WordleOptimizer(dictionary)._get_pattern_table()
+        assert len(os.listdir(tmp_path / "env")) == 1
+
+        # Disabled, by argument or environment
+        WordleOptimizer(dictionary, pattern_cache_dir="")._get_pattern_table()
+        os.environ[_PATTERN_CACHE_ENV] = ""
+        assert np.array_equal(WordleOptimizer(dictionary)._get_pattern_table(), table)
+        assert sorted(os.listdir(tmp_path)) == ["arg", "env"]
+    finally:
+        if previous is None:
+            del os.environ[_PATTERN_CACHE_ENV]
+        else:
+            os.environ[_PATTERN_CACHE_ENV] = previous
+
+    print("✓ Pattern cache directory test passed")
+
+
 def test_minimax_guess():
     """Test minimax strategy."""
     dictionary = ["hello", "hullo", "hallo", "hills", "halls"]
@@ -138,10 +211,14 @@ def run_all_tests():
 
     test_entropy_calculation()
     test_best_guess_by_entropy()
+    test_entropy_shortlist()
     test_letter_frequencies()
     test_word_scoring()
     test_strategic_first_guess()
     test_pattern_analysis()
+    test_analysis_cache()
+    with tempfile.TemporaryDirectory() as directory:
+        test_pattern_cache_dir(Path(directory))
     test_minimax_guess()
     test_hard_mode_guess()
 